@@ -0,0 +1,87 @@
+"""Runs the benchmarks and compares them with a stored baseline.
+
+Usage:
+    python -m benchmarks [--save-baseline] [--baseline PATH] [--tolerance 0.25]
+
+The exit code is 1 when any benchmark is more than ``tolerance`` worse than its
+baseline, so the benchmarks can be used to catch regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.suite import Result, run
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def regressions(
+    results: list[Result],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Returns a description of each result that is worse than its baseline."""
+    messages: list[str] = []
+    for result in results:
+        if result.name not in baseline:
+            continue
+
+        expected = baseline[result.name]["value"]
+        if result.higher_is_better:
+            regressed = result.value < expected * (1 - tolerance)
+        else:
+            regressed = result.value > expected * (1 + tolerance)
+
+        if regressed:
+            messages.append(
+                f"{result.name}: {result.value:.2f} {result.unit} "
+                f"(baseline {expected:.2f} {result.unit})",
+            )
+    return messages
+
+
+def main() -> int:
+    """Runs the benchmarks, returning the exit code."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    results = run(repeat=args.repeat, requests=args.requests, latency=args.latency)
+    if not results:
+        print("No saved responses were found, so nothing was benchmarked.")
+        return 0
+
+    for result in results:
+        print(f"{result.name:<40} {result.value:>14.2f} {result.unit}")
+
+    if args.save_baseline:
+        baseline = {result.name: asdict(result) for result in results}
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+
+    messages = regressions(
+        results,
+        json.loads(args.baseline.read_text()),
+        args.tolerance,
+    )
+    for message in messages:
+        print(f"Regression: {message}")
+    return 1 if messages else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Parse throughput and get() latency benchmarks for each endpoint."""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from rainbow_roll import RainbowRoll
+from rainbow_roll.base_api_endpoint import RawResponse
+from rainbow_roll.mock_server import FaultConfig, MockAdapter, MockAPI, load_responses
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rainbow_roll.base_api_endpoint import BaseEndpoint
+
+# get() arguments that the mock API answers with each endpoint's saved responses.
+GET_ARGUMENTS: dict[str, tuple[Any, ...]] = {
+    "browse_series": (),
+    "series": ("BENCHMARK",),
+    "seasons": ("BENCHMARK",),
+    "episodes": ("BENCHMARK",),
+}
+ENDPOINTS = tuple(GET_ARGUMENTS)
+CONCURRENCY_LEVELS = (1, 2, 4, 8, 16)
+
+
+@dataclass(frozen=True)
+class Result:
+    """A single benchmark measurement."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = True
+
+
+def _raw_responses(saved: list[dict[str, Any]]) -> list[RawResponse]:
+    """Returns saved responses as they are returned by ``download_raw()``."""
+    responses: list[RawResponse] = []
+    for response in saved:
+        body = dict(response)
+        metadata = body.pop("rainbow_roll", None) or {}
+        responses.append(RawResponse(json.dumps(body).encode(), metadata))
+    return responses
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    """Returns the fastest of several runs of function, in seconds."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _peak_memory(function: Callable[[], object]) -> int:
+    """Returns the peak number of bytes allocated while running function."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_benchmarks(
+    name: str,
+    endpoint: BaseEndpoint[Any],
+    fixtures: list[RawResponse],
+    repeat: int,
+) -> list[Result]:
+    """Measures how quickly an endpoint parses its saved responses.
+
+    ``parse()`` is timed from already decoded dicts, while ``parse_raw()`` is timed
+    from the response bodies. Lazy parsing is timed both on its own and with every
+    entry accessed afterwards.
+    """
+    dicts = [fixture.to_dict() for fixture in fixtures]
+    entries = sum(len(endpoint.parse(data).data) for data in dicts)
+    parse_time = _best_time(lambda: [endpoint.parse(data) for data in dicts], repeat)
+    parse_raw_time = _best_time(
+        lambda: [endpoint.parse_raw(fixture) for fixture in fixtures],
+        repeat,
+    )
+    lazy_time = _best_time(
+        lambda: [endpoint.parse_raw(fixture, lazy=True) for fixture in fixtures],
+        repeat,
+    )
+    lazy_all_time = _best_time(
+        lambda: [
+            list(endpoint.parse_raw(fixture, lazy=True).data) for fixture in fixtures
+        ],
+        repeat,
+    )
+    peak = max(_peak_memory(partial(endpoint.parse_raw, f)) for f in fixtures)
+
+    return [
+        Result(f"{name}.parse", len(dicts) / parse_time, "responses/s"),
+        Result(f"{name}.parse.entries", entries / parse_time, "entries/s"),
+        Result(f"{name}.parse_raw", len(fixtures) / parse_raw_time, "responses/s"),
+        Result(f"{name}.parse_raw.entries", entries / parse_raw_time, "entries/s"),
+        Result(f"{name}.parse_raw.lazy", len(fixtures) / lazy_time, "responses/s"),
+        Result(
+            f"{name}.parse_raw.lazy.all_entries",
+            len(fixtures) / lazy_all_time,
+            "responses/s",
+        ),
+        Result(
+            f"{name}.parse_raw.peak_memory",
+            peak / 1024,
+            "KiB",
+            higher_is_better=False,
+        ),
+    ]
+
+
+def _get_time(get: Callable[[], object], requests: int, workers: int) -> float:
+    """Returns how long it takes to call get the given number of times."""
+    get()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: get(), range(requests)))
+        return time.perf_counter() - start
+
+
+def get_benchmarks(
+    saved: dict[str, list[dict[str, Any]]],
+    requests: int,
+    latency: float,
+) -> list[Result]:
+    """Measures get() latency and how throughput scales with concurrency.
+
+    Requests are answered in-process by a ``MockAPI`` through a ``MockAdapter``, so
+    the latency is the overhead of the client itself. The concurrency benchmarks add
+    ``latency`` to every response to simulate the network. The adapter does not pool
+    connections, so they measure how the client scales with threads, not the size of
+    its connection pool.
+    """
+    results: list[Result] = []
+
+    with RainbowRoll(adapter=MockAdapter(MockAPI(saved))) as client:
+        for name, args in GET_ARGUMENTS.items():
+            if not saved.get(name):
+                continue
+            get = partial(getattr(client, name).get, *args)
+            elapsed = _get_time(get, requests, 1)
+            results.append(
+                Result(
+                    f"{name}.get.latency",
+                    elapsed / requests * 1000,
+                    "ms",
+                    higher_is_better=False,
+                ),
+            )
+
+    name = next((name for name in ENDPOINTS if saved.get(name)), None)
+    if name is None:
+        return results
+
+    adapter = MockAdapter(MockAPI(saved, FaultConfig(latency=latency)))
+    for workers in CONCURRENCY_LEVELS:
+        with RainbowRoll(adapter=adapter) as client:
+            get = partial(getattr(client, name).get, *GET_ARGUMENTS[name])
+            elapsed = _get_time(get, requests, workers)
+            results.append(
+                Result(
+                    f"{name}.get.workers_{workers}",
+                    requests / elapsed,
+                    "requests/s",
+                ),
+            )
+
+    return results
+
+
+def run(*, repeat: int = 5, requests: int = 100, latency: float = 0.02) -> list[Result]:
+    """Runs every benchmark over the saved responses of each endpoint.
+
+    Endpoints without saved responses are skipped.
+
+    Args:
+        repeat: The number of times each parse benchmark is run, the fastest run is
+            reported.
+        requests: The number of get() calls made by each get() benchmark.
+        latency: The simulated network latency for the concurrency benchmarks.
+    """
+    client = RainbowRoll()
+    saved = load_responses()
+    results: list[Result] = []
+
+    for name in ENDPOINTS:
+        if fixtures := _raw_responses(saved.get(name, [])):
+            endpoint = getattr(client, name)
+            results.extend(parse_benchmarks(name, endpoint, fixtures, repeat))
+
+    results.extend(get_benchmarks(saved, requests, latency))
+    return results
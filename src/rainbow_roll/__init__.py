@@ -1,31 +1,71 @@
 """RainbowRoll is a client for downloading and parsing data from Crunchyroll."""
 
-import base64
 import logging
-import re
+import threading
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from logging import Logger
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
 import requests
-
-from rainbow_roll.base_api_endpoint import BaseExtractor
+from requests.adapters import HTTPAdapter
+
+from rainbow_roll.auth import (
+    BUNDLE_JS_URL,
+    DEFAULT_REFRESH_MARGIN,
+    Tokens,
+    TokenStore,
+    access_token_data,
+    extract_public_token,
+    token_expiry,
+)
+from rainbow_roll.base_api_endpoint import BaseExtractor, RawResponse
 from rainbow_roll.browse_series import BrowseSeries
+from rainbow_roll.cache import ResponseCache
+from rainbow_roll.cassette import Cassette
 from rainbow_roll.episodes import Episodes
 from rainbow_roll.exceptions import HTTPError
+from rainbow_roll.instrumentation import (
+    Event,
+    Instrumentation,
+    RequestStarted,
+    RequestTrace,
+    TokenRefreshed,
+)
+from rainbow_roll.interning import Interner
+from rainbow_roll.objects import Objects
+from rainbow_roll.profiling import ParseProfiler
+from rainbow_roll.rate_limit import DEFAULT_RETRY_POLICY, RateLimiter, RetryPolicy
 from rainbow_roll.seasons import Seasons
 from rainbow_roll.series import Series
+from rainbow_roll.session import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    connect_time,
+    create_session,
+)
 
 DEVICE_ID = uuid.uuid4().hex
 DEFAULT_TIMEOUT = 30
 default_logger = logging.getLogger(__name__)
 
 
+def response_metadata(
+    url: str,
+    params: dict[str, Any],
+    headers: dict[str, str],
+) -> dict[str, Any]:
+    """Returns the request details that are stored alongside every response."""
+    return {"params": params, "headers": headers, "url": url}
+
+
 def response_models() -> list[BaseExtractor[Any]]:
     """Returns a list of all of the response models for RainbowRoll."""
     client = RainbowRoll()
 
+    # Objects is left out until its responses are saved and its models generated.
     return [
         client.browse_series,
         client.series,
@@ -47,102 +87,253 @@ class RainbowRoll:
         device_type: str = "Microsoft Edge on Windows",
         logger: Logger = default_logger,
         timeout: int = 30,
+        *,
+        session: requests.Session | None = None,
+        adapter: HTTPAdapter | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = 0,
+        keep_alive: bool = True,
+        cache: ResponseCache | None = None,
+        cassette: Cassette | None = None,
+        model_cache_size: int = 0,
+        model_cache_ttl: timedelta | None = None,
+        token_store: TokenStore | None = None,
+        refresh_margin: timedelta = DEFAULT_REFRESH_MARGIN,
+        auto_refresh: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        instrumentation: Instrumentation | None = None,
+        parse_profiler: ParseProfiler | None = None,
+        interner: Interner | None = None,
+        lazy_parse: bool = False,
     ) -> None:
-        """Initialize the RainbowRoll client."""
+        """Initialize the RainbowRoll client.
+
+        All requests made by the client share a single session so connections to
+        Crunchyroll are reused instead of being opened for every request. A custom
+        session can be passed in, in which case the client will not close it and the
+        pool arguments are ignored.
+
+        When a ``cache`` is given, API responses are served from it while they are
+        fresh and revalidated with the server once they are stale.
+
+        When a ``cassette`` is given, every API response is recorded to it if it is
+        recording, otherwise API requests are replayed from it without using the
+        network. A recording cassette is saved when the client is closed.
+
+        When ``model_cache_size`` is set, the series, seasons, and episodes endpoints
+        keep that many parsed models in memory for each endpoint, so repeated
+        ``get()`` calls for the same ID and locale do not download or parse anything.
+
+        When a ``token_store`` is given, tokens are loaded from it and saved to it so
+        they can be reused by other clients and processes until they expire.
+
+        Access tokens are refreshed ``refresh_margin`` before they expire, and only one
+        thread refreshes at a time while the others wait for its token. With
+        ``auto_refresh`` a background timer renews the token ahead of time so requests
+        never have to wait for it.
+
+        API and access token requests that fail with a connection error, a 429, or a
+        5xx status are retried according to ``retry_policy``. A ``rate_limiter``,
+        which can be shared between clients, limits how quickly requests are made and
+        slows down when the server throttles them.
+
+        When ``instrumentation`` is given, every request, token download, and parse
+        is reported to it as an event and aggregated into its metrics. A
+        ``parse_profiler`` records how long each nested model and field type takes to
+        validate, at the cost of much slower parsing.
+
+        With an ``interner``, repeated strings such as locales and ratings are shared
+        between every parsed model, which saves memory when many models are kept.
+
+        With ``lazy_parse`` the entries of every response are validated when they are
+        first accessed, which makes parsing faster when only some entries are used.
+        It can be changed for a single endpoint with its ``lazy_parse`` attribute, or
+        for a single call with the ``lazy`` argument of ``parse()``.
+        """
         self.logger = logger or default_logger
         self.timeout = timeout
+        self._owns_session = session is None
+        self.session = session or create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            keep_alive=keep_alive,
+            adapter=adapter,
+        )
+        self.cache = cache
+        self.cassette = cassette
+        self.model_cache_size = model_cache_size
+        self.model_cache_ttl = model_cache_ttl
         self.anonymous = not (username and password)
         self.username = username
         self.password = password
-        self.__token_expires_at = datetime.now(tz=UTC)
         self.device_id = device_id
         self.device_type = device_type
-        self.__public_token_value = ""
-        self.__access_token_value = ""
-        self.__refresh_token = ""
+        self.token_store = token_store
+        self.refresh_margin = refresh_margin
+        self.auto_refresh = auto_refresh
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.instrumentation = instrumentation
+        self.parse_profiler = parse_profiler
+        self.interner = interner
+        self.lazy_parse = lazy_parse
+        self.__tokens = Tokens()
+        self.__token_lock = threading.Lock()
+        self.__refresh_timer: threading.Timer | None = None
+        self.scheme = "https"
         self.domain = "beta-api.crunchyroll.com"
+        self.bundle_js_url = BUNDLE_JS_URL
 
         self.browse_series = BrowseSeries(self)
         self.series = Series(self)
         self.seasons = Seasons(self)
         self.episodes = Episodes(self)
+        self.objects = Objects(self)
 
         super().__init__()
 
+    def close(self) -> None:
+        """Close the underlying session if it was created by the client.
+
+        A recording cassette is saved.
+        """
+        if self.__refresh_timer:
+            self.__refresh_timer.cancel()
+
+        if self.cassette is not None and self.cassette.record:
+            self.cassette.save()
+
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the client when it exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client."""
+        self.close()
+
     @property
     def __public_token(self) -> str:
-        if not self.__public_token_value:
+        if not self.__tokens.public_token:
             self.__download_public_token()
 
-        return self.__public_token_value
-
-    @__public_token.setter
-    def __public_token(self, value: str) -> None:
-        self.__public_token_value = value
+        return self.__tokens.public_token
 
     def __download_public_token(self) -> None:
         """Get a public token from Crunchyroll."""
-        url = "https://static.crunchyroll.com/vilos-v2/web/vilos/js/bundle.js"
-        self.logger.info("Downloading public token: %s", url)
-        response = requests.get(url, timeout=self.timeout)
-        response_text = response.text
-
-        if not (match := re.search(r'prod="([\w-]+:[\w-]+)"', response_text)):
-            msg = "Failed to extract token from bundle.js"
-            raise ValueError(msg)
+        self.logger.info("Downloading public token: %s", self.bundle_js_url)
+        started = time.perf_counter()
+        response = self.session.get(self.bundle_js_url, timeout=self.timeout)
+        self.__tokens.public_token = extract_public_token(response.text)
+        self.__emit(TokenRefreshed("public", time.perf_counter() - started))
 
-        encoded_public_token = match.group(1)
-        self.__public_token = base64.b64encode(
-            encoded_public_token.encode("iso-8859-1"),
-        ).decode()
+    def __emit(self, event: Event) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.emit(event)
 
     @property
     def __access_token(self) -> str:
-        if not self.__access_token_value or self.__token_expires_at < datetime.now(
-            tz=UTC,
-        ):
+        if not self.__tokens.access_token_valid(self.refresh_margin):
+            with self.__token_lock:
+                # Another thread may have refreshed the token while this one waited.
+                if not self.__tokens.access_token_valid(self.refresh_margin):
+                    self.__refresh_access_token()
+
+        return self.__tokens.access_token
+
+    def __schedule_refresh(self) -> None:
+        """Start a timer that refreshes the access token before it expires."""
+        if self.__refresh_timer:
+            self.__refresh_timer.cancel()
+
+        # Never refresh sooner than halfway through the token's lifetime, otherwise
+        # a margin longer than the lifetime would refresh in a tight loop.
+        remaining = (self.__tokens.expires_at - datetime.now(tz=UTC)).total_seconds()
+        delay = max(remaining - self.refresh_margin.total_seconds(), remaining / 2, 0)
+        self.__refresh_timer = threading.Timer(delay, self.__refresh_in_background)
+        self.__refresh_timer.daemon = True
+        self.__refresh_timer.start()
+
+    def __refresh_in_background(self) -> None:
+        try:
+            with self.__token_lock:
+                self.__refresh_access_token()
+        except Exception:
+            # Requests will refresh the token themselves if this failed.
+            self.logger.exception("Failed to refresh access token in the background")
+
+    @property
+    def __token_store_key(self) -> str:
+        return self.username or "anonymous"
+
+    def __refresh_access_token(self) -> None:
+        """Get a valid access token, must be called while holding the token lock."""
+        self.__load_or_download_access_token()
+
+        if self.auto_refresh:
+            self.__schedule_refresh()
+
+    def __load_or_download_access_token(self) -> None:
+        """Get a valid access token from the token store or from Crunchyroll."""
+        if self.token_store is None:
             self.__download_access_token()
+            return
 
-        return self.__access_token_value
+        # Hold the lock while downloading so other processes sharing the store wait
+        # for this token instead of downloading their own.
+        with self.token_store.lock():
+            if stored_tokens := self.token_store.load(self.__token_store_key):
+                self.__tokens = stored_tokens
+                if self.__tokens.access_token_valid(self.refresh_margin):
+                    self.logger.info("Using stored access token")
+                    return
 
-    @__access_token.setter
-    def __access_token(self, value: str) -> None:
-        self.__access_token_value = value
+            self.__download_access_token()
+            self.token_store.save(self.__token_store_key, self.__tokens)
 
     def __download_access_token(self) -> None:
-        url = f"https://{self.domain}/auth/v1/token"
+        url = f"{self.scheme}://{self.domain}/auth/v1/token"
         headers = {"Authorization": f"Basic {self.__public_token}"}
+        data = access_token_data(
+            device_id=self.device_id,
+            device_type=self.device_type,
+            username=self.username,
+            password=self.password,
+            refresh_token=self.__tokens.refresh_token,
+        )
 
-        data: dict[str, Any] = {
-            "device_id": self.device_id,
-            "device_type": self.device_type,
-        }
-
-        if self.__refresh_token:
-            self.logger.info("Refreshing access token: %s", url)
-            data["grant_type"] = "refresh_token"
-            data["refresh_token"] = self.__refresh_token
-        elif self.anonymous:
-            self.logger.info("Downloading anonymous access token: %s", url)
-            data["grant_type"] = "client_id"
-        else:
-            self.logger.info("Downloading logged in access token: %s", url)
-            data["grant_type"] = "password"
-            data["scope"] = "offline_access"
-            data["username"] = self.username
-            data["device_name"] = self.password
-
-        response = requests.post(url, data, headers=headers, timeout=self.timeout)
+        self.logger.info("Downloading access token (%s): %s", data["grant_type"], url)
+        started = time.perf_counter()
+        response = self.__send_with_retries(
+            "POST",
+            url,
+            RequestTrace(),
+            data=data,
+            headers=headers,
+        )
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Unexpected token response status code: {response.status_code}"
+            raise HTTPError(msg)
         parsed_response = response.json()
 
-        self.__access_token = parsed_response["access_token"]
-        self.__token_expires_at = datetime.now(tz=UTC) + timedelta(
-            seconds=parsed_response["expires_in"],
-        )
+        self.__tokens.access_token = parsed_response["access_token"]
+        self.__tokens.expires_at = token_expiry(parsed_response["expires_in"])
 
         # Refresh token are only available when the user is logged into an account.
         if "refresh_token" in parsed_response:
-            self.__refresh_token = parsed_response["refresh_token"]
+            self.__tokens.refresh_token = parsed_response["refresh_token"]
+
+        self.__emit(TokenRefreshed("access", time.perf_counter() - started))
 
     def download(
         self,
@@ -151,23 +342,142 @@ class RainbowRoll:
         headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Make a request to the Crunchyroll API with the given endpoint."""
+        return self.download_raw(endpoint, params, headers).to_dict()
+
+    def download_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> RawResponse:
+        """Make a request to the Crunchyroll API without decoding the response.
+
+        The result can be passed to an endpoint's ``parse_raw()``.
+        """
         if headers is None:
             headers = {}
-        headers["authorization"] = f"Bearer {self.__access_token}"
 
-        url = f"https://{self.domain}/{endpoint}"
+        url = f"{self.scheme}://{self.domain}/{endpoint}"
+        trace = RequestTrace()
+        self.__emit(RequestStarted(endpoint, url, params))
+
+        try:
+            if self.cassette is not None and not self.cassette.record:
+                trace.source = "cassette"
+                body = self.cassette.play(endpoint, params, headers)
+            else:
+                body = self.__download_body(url, endpoint, params, headers, trace)
+                if self.cassette is not None:
+                    self.cassette.add(endpoint, params, headers, body)
+        except Exception as error:
+            self.__emit(trace.finished(endpoint, url, params, error=error))
+            raise
+
+        self.__emit(trace.finished(endpoint, url, params, body))
+        return RawResponse(body, response_metadata(url, params, headers))
+
+    def __send_with_retries(
+        self,
+        method: str,
+        url: str,
+        trace: RequestTrace,
+        # ANN401 - The arguments are passed through to the HTTP client.
+        **kwargs: Any,  # noqa: ANN401
+    ) -> requests.Response:
+        """Make a request, retrying it if it fails with a retryable error."""
+        policy = self.retry_policy or RetryPolicy(max_attempts=1)
+        attempt = 0
+
+        while True:
+            last_attempt = attempt >= policy.max_attempts - 1
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                retry_after = None
+            else:
+                # The elapsed time of a response runs until its headers were received,
+                # and includes opening the connection.
+                duration = time.perf_counter() - started
+                elapsed = response.elapsed.total_seconds()
+                connect = connect_time(response)
+                trace.response(
+                    response.status_code,
+                    connect_time=connect,
+                    time_to_first_byte=max(elapsed - (connect or 0), 0),
+                    download_time=max(duration - elapsed, 0),
+                )
+                if self.rate_limiter:
+                    self.rate_limiter.observe(response.status_code)
+
+                if last_attempt or response.status_code not in policy.retry_statuses:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            delay = policy.delay(attempt, retry_after)
+            self.logger.warning("Retrying API request in %.2fs: %s", delay, url)
+            time.sleep(delay)
+            attempt += 1
+            trace.retries = attempt
+
+    def __download_body(
+        self,
+        url: str,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        trace: RequestTrace,
+    ) -> bytes:
+        """Returns the body of a response, using the cache when possible."""
+        cached = self.cache.get(endpoint, params) if self.cache else None
+        if cached and cached.fresh:
+            self.logger.info("Using cached API data: %s", url)
+            trace.source = "cache"
+            return cached.body
+
+        request_headers = {
+            **headers,
+            **(cached.conditional_headers() if cached else {}),
+            "authorization": f"Bearer {self.__access_token}",
+        }
+
         self.logger.info("Downloading API data: %s", url)
-        response = requests.get(url, params, headers=headers, timeout=self.timeout)
+        response = self.__send_with_retries(
+            "GET",
+            url,
+            trace,
+            params=params,
+            headers=request_headers,
+        )
+
+        if cached and response.status_code == 304:  # noqa: PLR2004
+            self.logger.info("Cached API data is unchanged: %s", url)
+            trace.source = "cache"
+            if self.cache:
+                self.cache.touch(endpoint, params)
+            return cached.body
 
         if response.status_code != 200:  # noqa: PLR2004
             msg = f"Unexpected response status code: {response.status_code}"
             raise HTTPError(msg)
 
-        output = response.json()
-        output["rainbow_roll"] = {}
-        output["rainbow_roll"]["params"] = params
-        headers.pop("authorization")
-        output["rainbow_roll"]["headers"] = headers
-        output["rainbow_roll"]["url"] = url
+        if self.cache:
+            self.cache.set(
+                endpoint,
+                params,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
 
-        return output
+        return response.content
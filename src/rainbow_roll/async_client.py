@@ -0,0 +1,403 @@
+"""AsyncRainbowRoll is an asyncio client for downloading and parsing Crunchyroll data.
+
+This module requires the optional ``httpx`` dependency, which can be installed with
+the ``async`` extra.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from rainbow_roll import DEFAULT_TIMEOUT, DEVICE_ID, default_logger, response_metadata
+from rainbow_roll.auth import (
+    BUNDLE_JS_URL,
+    DEFAULT_REFRESH_MARGIN,
+    Tokens,
+    access_token_data,
+    extract_public_token,
+    token_expiry,
+)
+from rainbow_roll.base_api_endpoint import RawResponse
+from rainbow_roll.browse_series import AsyncBrowseSeries
+from rainbow_roll.episodes import AsyncEpisodes
+from rainbow_roll.exceptions import HTTPError
+from rainbow_roll.instrumentation import RequestStarted, RequestTrace, TokenRefreshed
+from rainbow_roll.objects import AsyncObjects
+from rainbow_roll.rate_limit import DEFAULT_RETRY_POLICY, RateLimiter, RetryPolicy
+from rainbow_roll.seasons import AsyncSeasons
+from rainbow_roll.series import AsyncSeries
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from datetime import timedelta
+    from logging import Logger
+    from types import TracebackType
+
+    from rainbow_roll.auth import TokenStore
+    from rainbow_roll.cassette import Cassette
+    from rainbow_roll.instrumentation import Event, Instrumentation
+    from rainbow_roll.interning import Interner
+    from rainbow_roll.profiling import ParseProfiler
+
+DEFAULT_MAX_CONCURRENCY = 50
+
+
+@asynccontextmanager
+async def _locked(token_store: TokenStore) -> AsyncIterator[None]:
+    """Holds the lock of a token store without blocking the event loop."""
+    lock = token_store.lock()
+    await asyncio.to_thread(lock.__enter__)
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(lock.__exit__, None, None, None)
+
+
+class _PhaseTimer:
+    """Times the phases of a request from the events of httpx's trace extension."""
+
+    # The connection steps that open a new connection to the server.
+    CONNECT_STEPS = frozenset({"connect_tcp", "connect_unix_socket", "start_tls"})
+
+    def __init__(self) -> None:
+        self.started: dict[str, float] = {}
+        self.completed: dict[str, float] = {}
+        self.connect_time = 0.0
+
+    # ARG002 - The details of each event are not needed, only when it happened.
+    async def trace(self, name: str, info: dict[str, Any]) -> None:  # noqa: ARG002
+        """Record the time of a trace event, like ``http11.send_request_headers``."""
+        now = time.perf_counter()
+        step, _, stage = name.partition(".")[2].rpartition(".")
+        if stage == "started":
+            self.started[step] = now
+        elif stage == "complete":
+            self.completed[step] = now
+            if step in self.CONNECT_STEPS:
+                self.connect_time += now - self.started[step]
+
+    def between(self, start: str, end: str) -> float | None:
+        """Returns the seconds from one event to another, if both happened."""
+        if start not in self.started or end not in self.completed:
+            return None
+        return self.completed[end] - self.started[start]
+
+    def record(self, trace: RequestTrace, status: int) -> None:
+        """Record the response and the time of each phase of the request."""
+        headers = self.completed.get("receive_response_headers")
+        body = self.completed.get("receive_response_body")
+        trace.response(
+            status,
+            # A transport that does not support tracing reports no events.
+            connect_time=self.connect_time if self.started else None,
+            time_to_first_byte=self.between(
+                "send_request_headers",
+                "receive_response_headers",
+            ),
+            download_time=None if headers is None or body is None else body - headers,
+        )
+
+
+class AsyncRainbowRoll:
+    """Asyncio interface for downloading and parsing data from Crunchyroll."""
+
+    # PLR0913 - Need more arguements to do everything required.
+    def __init__(  # noqa: PLR0913
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        # These values were chosen to match the CrunchyRoll app on Windows.
+        device_id: str = DEVICE_ID,
+        device_type: str = "Microsoft Edge on Windows",
+        logger: Logger = default_logger,
+        timeout: int = DEFAULT_TIMEOUT,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cassette: Cassette | None = None,
+        token_store: TokenStore | None = None,
+        refresh_margin: timedelta = DEFAULT_REFRESH_MARGIN,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        instrumentation: Instrumentation | None = None,
+        parse_profiler: ParseProfiler | None = None,
+        interner: Interner | None = None,
+        lazy_parse: bool = False,
+    ) -> None:
+        """Initialize the AsyncRainbowRoll client.
+
+        At most ``max_concurrency`` requests are in flight at once, and the connection
+        pool is sized to match. A custom ``httpx.AsyncClient`` can be passed in, in
+        which case the client will not close it. Tokens are loaded from and saved to
+        the ``token_store`` when one is given, and are refreshed ``refresh_margin``
+        before they expire. Requests are rate limited and retried the same way as
+        with ``RainbowRoll``, and a ``cassette`` records and replays responses the
+        same way. Events are reported to
+        ``instrumentation`` like they are by ``RainbowRoll``, with the phases of each
+        request timed from httpx's trace extension, and ``parse_profiler``,
+        ``interner``, and ``lazy_parse`` are used the same way.
+        """
+        self.logger = logger or default_logger
+        self.timeout = timeout
+        self.anonymous = not (username and password)
+        self.username = username
+        self.password = password
+        self.device_id = device_id
+        self.device_type = device_type
+        self.scheme = "https"
+        self.domain = "beta-api.crunchyroll.com"
+        self.bundle_js_url = BUNDLE_JS_URL
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.cassette = cassette
+
+        self.token_store = token_store
+        self.refresh_margin = refresh_margin
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.instrumentation = instrumentation
+        self.parse_profiler = parse_profiler
+        self.interner = interner
+        self.lazy_parse = lazy_parse
+        self._token_lock = asyncio.Lock()
+        self._tokens = Tokens()
+
+        self.browse_series = AsyncBrowseSeries(self)
+        self.series = AsyncSeries(self)
+        self.seasons = AsyncSeasons(self)
+        self.episodes = AsyncEpisodes(self)
+        self.objects = AsyncObjects(self)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if it was created by the client.
+
+        A recording cassette is saved.
+        """
+        if self.cassette is not None and self.cassette.record:
+            self.cassette.save()
+
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter a context that closes the client when it exits."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client."""
+        await self.aclose()
+
+    async def _download_public_token(self) -> None:
+        """Get a public token from Crunchyroll."""
+        self.logger.info("Downloading public token: %s", self.bundle_js_url)
+        started = time.perf_counter()
+        response = await self.http_client.get(self.bundle_js_url)
+        self._tokens.public_token = extract_public_token(response.text)
+        self._emit(TokenRefreshed("public", time.perf_counter() - started))
+
+    def _emit(self, event: Event) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.emit(event)
+
+    async def _download_access_token(self) -> None:
+        if not self._tokens.public_token:
+            await self._download_public_token()
+
+        url = f"{self.scheme}://{self.domain}/auth/v1/token"
+        headers = {"Authorization": f"Basic {self._tokens.public_token}"}
+        data = access_token_data(
+            device_id=self.device_id,
+            device_type=self.device_type,
+            username=self.username,
+            password=self.password,
+            refresh_token=self._tokens.refresh_token,
+        )
+
+        self.logger.info("Downloading access token (%s): %s", data["grant_type"], url)
+        started = time.perf_counter()
+        response = await self._send_with_retries(
+            "POST",
+            url,
+            RequestTrace(),
+            data=data,
+            headers=headers,
+        )
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Unexpected token response status code: {response.status_code}"
+            raise HTTPError(msg)
+        parsed_response = response.json()
+
+        self._tokens.access_token = parsed_response["access_token"]
+        self._tokens.expires_at = token_expiry(parsed_response["expires_in"])
+
+        # Refresh token are only available when the user is logged into an account.
+        if "refresh_token" in parsed_response:
+            self._tokens.refresh_token = parsed_response["refresh_token"]
+
+        self._emit(TokenRefreshed("access", time.perf_counter() - started))
+
+    async def _refresh_access_token(self) -> None:
+        """Get a valid access token from the token store or from Crunchyroll."""
+        if self.token_store is None:
+            await self._download_access_token()
+            return
+
+        key = self.username or "anonymous"
+        # Hold the lock while downloading so other clients sharing the store wait
+        # for this token instead of downloading their own.
+        async with _locked(self.token_store):
+            if stored_tokens := await asyncio.to_thread(self.token_store.load, key):
+                self._tokens = stored_tokens
+                if self._tokens.access_token_valid(self.refresh_margin):
+                    self.logger.info("Using stored access token")
+                    return
+
+            await self._download_access_token()
+            await asyncio.to_thread(self.token_store.save, key, self._tokens)
+
+    async def access_token(self) -> str:
+        """Returns a valid access token, refreshing it if it has expired.
+
+        Concurrent callers wait for a single refresh instead of each starting one.
+        """
+        if not self._tokens.access_token_valid(self.refresh_margin):
+            async with self._token_lock:
+                if not self._tokens.access_token_valid(self.refresh_margin):
+                    await self._refresh_access_token()
+
+        return self._tokens.access_token
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        trace: RequestTrace,
+        # ANN401 - The arguments are passed through to the HTTP client.
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """Make a request, retrying it if it fails with a retryable error."""
+        policy = self.retry_policy or RetryPolicy(max_attempts=1)
+        attempt = 0
+
+        while True:
+            last_attempt = attempt >= policy.max_attempts - 1
+            if self.rate_limiter and (delay := self.rate_limiter.reserve()):
+                await asyncio.sleep(delay)
+
+            timer = _PhaseTimer()
+            try:
+                async with self.semaphore:
+                    response = await self.http_client.request(
+                        method,
+                        url,
+                        extensions={"trace": timer.trace},
+                        **kwargs,
+                    )
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                retry_after = None
+            else:
+                timer.record(trace, response.status_code)
+                if self.rate_limiter:
+                    self.rate_limiter.observe(response.status_code)
+
+                if last_attempt or response.status_code not in policy.retry_statuses:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+
+            delay = policy.delay(attempt, retry_after)
+            self.logger.warning("Retrying API request in %.2fs: %s", delay, url)
+            await asyncio.sleep(delay)
+            attempt += 1
+            trace.retries = attempt
+
+    async def download(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Make a request to the Crunchyroll API with the given endpoint."""
+        return (await self.download_raw(endpoint, params, headers)).to_dict()
+
+    async def download_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> RawResponse:
+        """Make a request to the Crunchyroll API without decoding the response.
+
+        The result can be passed to an endpoint's ``parse_raw()``.
+        """
+        if headers is None:
+            headers = {}
+
+        url = f"{self.scheme}://{self.domain}/{endpoint}"
+        trace = RequestTrace()
+        self._emit(RequestStarted(endpoint, url, params))
+
+        try:
+            body = await self._download_body(url, endpoint, params, headers, trace)
+        except Exception as error:
+            self._emit(trace.finished(endpoint, url, params, error=error))
+            raise
+
+        self._emit(trace.finished(endpoint, url, params, body))
+        return RawResponse(body, response_metadata(url, params, headers))
+
+    async def _download_body(
+        self,
+        url: str,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        trace: RequestTrace,
+    ) -> bytes:
+        """Returns the body of a response, from the cassette when replaying one."""
+        if self.cassette is not None and not self.cassette.record:
+            trace.source = "cassette"
+            return self.cassette.play(endpoint, params, headers)
+
+        request_headers = {
+            **headers,
+            "authorization": f"Bearer {await self.access_token()}",
+        }
+        # requests leaves out parameters that are None, so match that behavior.
+        query = {key: value for key, value in params.items() if value is not None}
+        self.logger.info("Downloading API data: %s", url)
+        response = await self._send_with_retries(
+            "GET",
+            url,
+            trace,
+            params=query,
+            headers=request_headers,
+        )
+
+        if response.status_code != 200:  # noqa: PLR2004
+            msg = f"Unexpected response status code: {response.status_code}"
+            raise HTTPError(msg)
+
+        if self.cassette is not None:
+            self.cassette.add(endpoint, params, headers, response.content)
+
+        return response.content
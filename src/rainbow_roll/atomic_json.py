@@ -0,0 +1,28 @@
+"""Reading and atomically replacing the JSON files used by the file stores."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def read_json(path: Path) -> dict[str, Any]:
+    """Returns the JSON object in a file, or an empty dict if it can't be read."""
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    """Writes a JSON object to a file, replacing the file atomically.
+
+    The data is written to a temporary file in the same directory, which then
+    replaces the file, so readers never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as temp_file:
+        json.dump(data, temp_file)
+    Path(temp_file.name).replace(path)
@@ -0,0 +1,190 @@
+"""Authentication helpers shared by the RainbowRoll clients."""
+
+from __future__ import annotations
+
+import base64
+import os
+import re
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from rainbow_roll.atomic_json import read_json, write_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+BUNDLE_JS_URL = "https://static.crunchyroll.com/vilos-v2/web/vilos/js/bundle.js"
+# Tokens are renewed this long before they expire so they can't expire mid-request.
+DEFAULT_REFRESH_MARGIN = timedelta(seconds=60)
+
+
+def extract_public_token(bundle_js: str) -> str:
+    """Extracts the public token from the contents of the Crunchyroll bundle.js.
+
+    Args:
+        bundle_js: The text of the bundle.js file.
+
+    Returns:
+        The base64 encoded public token used for basic authentication.
+    """
+    if not (match := re.search(r'prod="([\w-]+:[\w-]+)"', bundle_js)):
+        msg = "Failed to extract token from bundle.js"
+        raise ValueError(msg)
+
+    encoded_public_token = match.group(1)
+    return base64.b64encode(encoded_public_token.encode("iso-8859-1")).decode()
+
+
+def access_token_data(
+    *,
+    device_id: str,
+    device_type: str,
+    username: str | None,
+    password: str | None,
+    refresh_token: str,
+) -> dict[str, Any]:
+    """Builds the form data for an access token request.
+
+    A refresh token is used when one is available, otherwise the grant type depends
+    on whether the client is logged into an account.
+
+    Args:
+        device_id: The device ID of the client.
+        device_type: The device type of the client.
+        username: The username of the account, if any.
+        password: The password of the account, if any.
+        refresh_token: The refresh token from a previous request, if any.
+
+    Returns:
+        The form data to post to the token endpoint.
+    """
+    data: dict[str, Any] = {
+        "device_id": device_id,
+        "device_type": device_type,
+    }
+
+    if refresh_token:
+        data["grant_type"] = "refresh_token"
+        data["refresh_token"] = refresh_token
+    elif not (username and password):
+        data["grant_type"] = "client_id"
+    else:
+        data["grant_type"] = "password"
+        data["scope"] = "offline_access"
+        data["username"] = username
+        data["password"] = password
+
+    return data
+
+
+def token_expiry(expires_in: float) -> datetime:
+    """Returns when a token that expires in the given number of seconds expires."""
+    return datetime.now(tz=UTC) + timedelta(seconds=expires_in)
+
+
+@dataclass
+class Tokens:
+    """The tokens used to authenticate with Crunchyroll."""
+
+    public_token: str = ""
+    access_token: str = ""
+    refresh_token: str = ""
+    expires_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+
+    def access_token_valid(self, margin: timedelta = timedelta(0)) -> bool:
+        """Returns whether the access token exists and is valid for at least margin."""
+        return bool(self.access_token) and (
+            self.expires_at - margin > datetime.now(tz=UTC)
+        )
+
+    def to_dict(self) -> dict[str, str]:
+        """Returns the tokens as a JSON serializable dict."""
+        return {**asdict(self), "expires_at": self.expires_at.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str]) -> Tokens:
+        """Creates tokens from a dict returned by ``to_dict()``."""
+        return cls(
+            public_token=data["public_token"],
+            access_token=data["access_token"],
+            refresh_token=data["refresh_token"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+        )
+
+
+class TokenStore(Protocol):
+    """Persists tokens so they can be shared between clients and processes."""
+
+    def load(self, key: str) -> Tokens | None:
+        """Returns the stored tokens for a key, if there are any."""
+        ...
+
+    def save(self, key: str, tokens: Tokens) -> None:
+        """Stores the tokens for a key."""
+        ...
+
+    def lock(self) -> AbstractContextManager[None]:
+        """Returns a context manager that holds an exclusive lock on the store."""
+        ...
+
+
+class FileTokenStore:
+    """Stores tokens in a JSON file guarded by an exclusive file lock.
+
+    The lock is held by the clients while they refresh their tokens, so when several
+    processes share the file only one of them downloads a new token.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize the store with the path of the JSON file."""
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def load(self, key: str) -> Tokens | None:
+        """Returns the stored tokens for a key, if there are any."""
+        if data := read_json(self.path).get(key):
+            return Tokens.from_dict(data)
+        return None
+
+    def save(self, key: str, tokens: Tokens) -> None:
+        """Stores the tokens for a key, replacing the file atomically."""
+        data = read_json(self.path)
+        data[key] = tokens.to_dict()
+        write_json(self.path, data)
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Holds an exclusive lock on the store, waiting for other processes."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock_file:
+            _lock_file(lock_file.fileno())
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file.fileno())
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
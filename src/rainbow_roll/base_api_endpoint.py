@@ -2,23 +2,76 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
+import time
 from functools import cached_property
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, Any, NamedTuple, override
 
 from gapi import GAPIClient
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 
+from rainbow_roll.cache import ModelCache
 from rainbow_roll.constants import FILES_PATH
+from rainbow_roll.instrumentation import ResponseParsed
+from rainbow_roll.lazy import validate_lazily
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
     from pathlib import Path
 
     from rainbow_roll import RainbowRoll
+    from rainbow_roll.async_client import AsyncRainbowRoll
+    from rainbow_roll.instrumentation import Instrumentation
+    from rainbow_roll.interning import Interner
+    from rainbow_roll.profiling import ParseProfiler
+
+
+class Request(NamedTuple):
+    """The arguments for a single API request."""
+
+    endpoint: str
+    params: dict[str, Any]
+    headers: dict[str, str]
+
+
+class RawResponse(NamedTuple):
+    """The undecoded body of a response and the metadata stored alongside it."""
+
+    body: bytes
+    metadata: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the response as the dict returned by ``download()``."""
+        output = from_json(self.body)
+        output["rainbow_roll"] = self.metadata
+        return output
+
+    def to_json(self) -> bytes:
+        """Returns the response as JSON with the metadata added to the body.
+
+        The metadata is spliced into the end of the body so the body never has to be
+        decoded into Python objects.
+        """
+        body = self.body.rstrip()
+        metadata = json.dumps(self.metadata, separators=(",", ":")).encode()
+        separator = b"" if body[:-1].rstrip().endswith(b"{") else b","
+        return body[:-1] + separator + b'"rainbow_roll":' + metadata + b"}"
 
 
 class BaseExtractor[T: BaseModel](GAPIClient[T]):
     """Base class to extract data from API responses."""
 
+    # Parse times are reported to the client's instrumentation, if it has one.
+    instrumentation: Instrumentation | None = None
+    # Validated responses are profiled model by model when a profiler is set.
+    parse_profiler: ParseProfiler | None = None
+    # Repeated strings in parsed models are shared when an interner is set.
+    interner: Interner | None = None
+    # Entries are validated when they are first accessed instead of when parsed.
+    lazy_parse = False
+
     @cached_property
     @override
     def _root_files_path(self) -> Path:
@@ -29,6 +82,100 @@ class BaseExtractor[T: BaseModel](GAPIClient[T]):
         """Wrapper for tests."""
         return self._json_files_folder
 
+    @override
+    def parse(self, data: dict[str, Any], *, lazy: bool | None = None) -> T:
+        """Parse the raw JSON data for a response into a model.
+
+        Args:
+            data: The raw JSON data.
+            lazy: Validate the entries of the response when they are first accessed
+                instead of now, defaults to ``lazy_parse``. Entries that do not match
+                their model only raise ``ValidationError`` when they are accessed, so
+                pass False where changes to the API must be caught while parsing.
+
+        Returns:
+            The parsed model.
+        """
+        started = time.perf_counter()
+        if (model := self._parse_lazily(data, lazy=lazy)) is None:
+            model = self._parse(data)
+            if self.interner is not None:
+                self.interner.intern(model)
+        self._parsed(started)
+        return model
+
+    def _parse_lazily(
+        self,
+        data: dict[str, Any],
+        *,
+        lazy: bool | None,
+    ) -> T | None:
+        """Parse data with lazily validated entries if lazy parsing is enabled.
+
+        Returns None when the response has to be parsed normally instead, which is
+        always the case while a profiler is set.
+        """
+        if not (self.lazy_parse if lazy is None else lazy) or self.parse_profiler:
+            return None
+
+        on_validate = self.interner.intern if self.interner is not None else None
+        try:
+            return validate_lazily(self._response_model, data, on_validate)
+        except ValidationError:
+            return None
+
+    def _parse(self, data: dict[str, Any]) -> T:
+        """Parse data with GAPIClient.parse, profiling it first if a profiler is set.
+
+        The profiled model is discarded so responses are always handled by
+        GAPIClient.parse, including ones that do not match the model.
+        """
+        if self.parse_profiler is not None:
+            with contextlib.suppress(ValidationError):
+                self.parse_profiler.profile(self._response_model, data)
+
+        return super().parse(data)
+
+    def _parsed(self, started: float) -> None:
+        """Report how long a parse that started at started took."""
+        if self.instrumentation is not None:
+            self.instrumentation.emit(
+                ResponseParsed(
+                    self._response_model.__name__,
+                    time.perf_counter() - started,
+                ),
+            )
+
+    def parse_raw(self, response: RawResponse, *, lazy: bool | None = None) -> T:
+        """Parse a raw response into a model without decoding it into a dict first.
+
+        The JSON is validated by pydantic-core directly, which is much faster than
+        decoding it and validating the dict. Responses that do not match the model
+        are passed to ``parse()`` so they are handled the same way as always, as are
+        all responses while a ``parse_profiler`` is set or while parsing lazily.
+
+        Args:
+            response: The raw response from ``download_raw()``.
+            lazy: Passed to ``parse()``, defaults to ``lazy_parse``.
+
+        Returns:
+            The parsed model.
+        """
+        if self.parse_profiler is not None or (
+            self.lazy_parse if lazy is None else lazy
+        ):
+            return self.parse(response.to_dict(), lazy=lazy)
+
+        started = time.perf_counter()
+        try:
+            model = self._response_model.model_validate_json(response.to_json())
+        except ValidationError:
+            model = self._parse(response.to_dict())
+        if self.interner is not None:
+            self.interner.intern(model)
+        self._parsed(started)
+        return model
+
 
 class BaseEndpoint[T: BaseModel](BaseExtractor[T]):
     """Base class for API endpoints."""
@@ -36,3 +183,36 @@ class BaseEndpoint[T: BaseModel](BaseExtractor[T]):
     def __init__(self, client: RainbowRoll) -> None:
         """Initialize the endpoint with the RainbowRoll client."""
         self._client = client
+        self.instrumentation = client.instrumentation
+        self.parse_profiler = client.parse_profiler
+        self.interner = client.interner
+        self.lazy_parse = client.lazy_parse
+        self.model_cache: ModelCache[T] | None = None
+        if client.model_cache_size:
+            self.model_cache = ModelCache(
+                client.model_cache_size,
+                client.model_cache_ttl,
+            )
+
+    def _cached_get(self, key: Hashable, get: Callable[[], T]) -> T:
+        """Returns the cached model for a key, calling get to create it if needed."""
+        if self.model_cache is None:
+            return get()
+
+        if (model := self.model_cache.get(key)) is None:
+            model = get()
+            self.model_cache.set(key, model)
+
+        return model
+
+
+class AsyncBaseEndpoint[T: BaseModel](BaseExtractor[T]):
+    """Base class for API endpoints used by the asyncio client."""
+
+    def __init__(self, client: AsyncRainbowRoll) -> None:
+        """Initialize the endpoint with the AsyncRainbowRoll client."""
+        self._client = client
+        self.instrumentation = client.instrumentation
+        self.parse_profiler = client.parse_profiler
+        self.interner = client.interner
+        self.lazy_parse = client.lazy_parse
@@ -2,12 +2,47 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import cached_property
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 
-from rainbow_roll.base_api_endpoint import BaseEndpoint
+from rainbow_roll.base_api_endpoint import AsyncBaseEndpoint, BaseEndpoint, Request
 from rainbow_roll.browse_series import models
+from rainbow_roll.collection import IndexedEntries
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+
+    from rainbow_roll.projection import Projection
+
+
+def _request(
+    *,
+    start: int | None,
+    n: int,
+    sort_by: str,
+    ratings: str,
+    locale: str,
+) -> Request:
+    params: dict[str, str | int] = {
+        "n": n,
+        "sort_by": sort_by,
+        "ratings": ratings,
+        "locale": locale,
+    }
+
+    if start is not None:
+        params["start"] = start
+
+    headers = {"referer": "https://www.crunchyroll.com/videos/new"}
+
+    return Request("content/v2/discover/browse", params, headers)
+
+
+def _is_last_page(page: models.BrowseSeries, n: int, end_datetime: datetime) -> bool:
+    return len(page.data) < n or page.data[-1].last_public < end_datetime
 
 
 class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
@@ -39,23 +74,14 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
         Returns:
             The raw JSON response as a dict, suitable for passing to ``parse()``.
         """
-        params: dict[str, str | int] = {
-            "n": n,
-            "sort_by": sort_by,
-            "ratings": ratings,
-            "locale": locale,
-        }
-
-        if start is not None:
-            params["start"] = start
-
-        headers = {"referer": "https://www.crunchyroll.com/videos/new"}
-
-        return self._client.download(
-            "content/v2/discover/browse",
-            params,
-            headers,
+        request = _request(
+            start=start,
+            n=n,
+            sort_by=sort_by,
+            ratings=ratings,
+            locale=locale,
         )
+        return self._client.download(*request)
 
     def get(
         self,
@@ -68,7 +94,8 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
     ) -> models.BrowseSeries:
         """Downloads and parses browse series data.
 
-        Convenience method that calls ``download()`` then ``parse()``.
+        Convenience method that downloads the response and parses it with
+        ``parse_raw()``.
 
         Args:
             start: The starting index for pagination.
@@ -80,16 +107,48 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
         Returns:
             A BrowseSeries model containing the parsed data.
         """
-        data = self.download(
+        request = _request(
+            start=start,
             n=n,
             sort_by=sort_by,
+            ratings=ratings,
             locale=locale,
+        )
+        return self.parse_raw(self._client.download_raw(*request))
+
+    def get_projected[R: tuple[Any, ...]](  # noqa: PLR0913
+        self,
+        projection: Projection[R],
+        *,
+        start: int | None = None,
+        n: int = 36,
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads browse series data and parses only the fields of a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            start: The starting index for pagination.
+            n: The number of results per page.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        request = _request(
             start=start,
+            n=n,
+            sort_by=sort_by,
             ratings=ratings,
+            locale=locale,
         )
-        return self.parse(data)
+        return projection.parse_raw(self._client.download_raw(*request))
 
-    def get_since_datetime(
+    def iter_pages(  # noqa: PLR0913
         self,
         *,
         n: int = 36,
@@ -97,8 +156,15 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
         sort_by: str = "newly_added",
         ratings: str = "true",
         end_datetime: datetime | None = None,
-    ) -> list[models.BrowseSeries]:
-        """Gets all browse pages until end_date is reached (inclusive).
+        prefetch: int = 0,
+    ) -> Iterator[models.BrowseSeries]:
+        """Yields browse pages as they arrive until end_date is reached (inclusive).
+
+        The first page includes the total number of entries, which is used to plan
+        the offsets of the remaining pages. With ``prefetch`` set, up to that many of
+        the following pages are downloaded in the background while the current page
+        is being processed. Stopping the iteration early cancels any pages that have
+        not started downloading yet.
 
         Args:
             n: The number of results per page.
@@ -106,16 +172,15 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
             sort_by: The sort order.
             ratings: Whether to include ratings.
             end_datetime: Stop when reaching this datetime.
+            prefetch: The number of pages to download ahead of the current page.
 
-        Returns:
-            List of BrowseSeries pages.
+        Yields:
+            BrowseSeries pages.
         """
-        start = 0
-        all_data: list[models.BrowseSeries] = []
         end_datetime = end_datetime or datetime.now().astimezone()
 
-        while True:
-            result = self.get(
+        def get_page(start: int) -> models.BrowseSeries:
+            return self.get(
                 n=n,
                 locale=locale,
                 start=start,
@@ -123,12 +188,95 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
                 ratings=ratings,
             )
 
-            all_data.append(result)
+        page = get_page(0)
+        offsets = iter(range(n, page.total, n))
+        pending: deque[Future[models.BrowseSeries]] = deque()
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
 
-            if result.data[-1].last_public < end_datetime or len(result.data) < n:
-                return all_data
+        try:
+            while True:
+                is_last_page = _is_last_page(page, n, end_datetime)
+                if not is_last_page:
+                    while len(pending) < prefetch:
+                        if (start := next(offsets, None)) is None:
+                            break
+                        pending.append(executor.submit(get_page, start))
 
-            start += n
+                yield page
+
+                if is_last_page:
+                    return
+
+                if pending:
+                    page = pending.popleft().result()
+                elif (start := next(offsets, None)) is not None:
+                    page = get_page(start)
+                else:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_entries(  # noqa: PLR0913
+        self,
+        *,
+        n: int = 36,
+        locale: str = "en-US",
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        end_datetime: datetime | None = None,
+        prefetch: int = 0,
+    ) -> Iterator[models.Datum]:
+        """Yields the entries of each browse page as they arrive.
+
+        Takes the same arguments as ``iter_pages()``.
+        """
+        for page in self.iter_pages(
+            n=n,
+            locale=locale,
+            sort_by=sort_by,
+            ratings=ratings,
+            end_datetime=end_datetime,
+            prefetch=prefetch,
+        ):
+            yield from page.data
+
+    def get_since_datetime(  # noqa: PLR0913
+        self,
+        *,
+        n: int = 36,
+        locale: str = "en-US",
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        end_datetime: datetime | None = None,
+        max_workers: int = 1,
+    ) -> list[models.BrowseSeries]:
+        """Gets all browse pages until end_date is reached (inclusive).
+
+        When ``max_workers`` is more than one the pages are fetched in parallel, and
+        any pages that are past ``end_datetime`` are discarded.
+
+        Args:
+            n: The number of results per page.
+            locale: The locale for the request.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            end_datetime: Stop when reaching this datetime.
+            max_workers: The number of pages to fetch at the same time.
+
+        Returns:
+            List of BrowseSeries pages.
+        """
+        return list(
+            self.iter_pages(
+                n=n,
+                locale=locale,
+                sort_by=sort_by,
+                ratings=ratings,
+                end_datetime=end_datetime,
+                # A single worker fetches the pages one at a time without speculating.
+                prefetch=max_workers if max_workers > 1 else 0,
+            ),
+        )
 
     def entries(
         self,
@@ -146,3 +294,163 @@ class BrowseSeries(BaseEndpoint[models.BrowseSeries]):
             input_data = self.parse(input_data)
 
         return input_data.data
+
+    def indexed_entries(
+        self,
+        input_data: models.BrowseSeries | list[models.BrowseSeries] | dict[str, Any],
+        *,
+        indexes: Iterable[str] = ("slug_title", "channel_id"),
+    ) -> IndexedEntries[models.Datum]:
+        """Returns the entries of one or more BrowseSeries indexed by ID.
+
+        Series that appear on more than one page are only included once, keeping the
+        entry with the latest ``last_public``.
+
+        Args:
+            input_data: The responses to get the entries from.
+            indexes: The fields to build secondary indexes for.
+
+        Returns:
+            The entries, which can be looked up by ID or by an indexed field.
+        """
+        return IndexedEntries(self.entries(input_data), indexes=indexes)
+
+
+class AsyncBrowseSeries(AsyncBaseEndpoint[models.BrowseSeries]):
+    """Provides async methods to download, parse, and retrieve browse series data."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.BrowseSeries]:
+        return models.BrowseSeries
+
+    async def download(
+        self,
+        *,
+        start: int | None = None,
+        n: int = 36,
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads browse series data.
+
+        Args:
+            start: The starting index for pagination.
+            n: The number of results per page.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        request = _request(
+            start=start,
+            n=n,
+            sort_by=sort_by,
+            ratings=ratings,
+            locale=locale,
+        )
+        return await self._client.download(*request)
+
+    async def get(
+        self,
+        *,
+        start: int | None = None,
+        n: int = 36,
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        locale: str = "en-US",
+    ) -> models.BrowseSeries:
+        """Downloads and parses browse series data.
+
+        Args:
+            start: The starting index for pagination.
+            n: The number of results per page.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            locale: The locale for the request.
+
+        Returns:
+            A BrowseSeries model containing the parsed data.
+        """
+        request = _request(
+            start=start,
+            n=n,
+            sort_by=sort_by,
+            ratings=ratings,
+            locale=locale,
+        )
+        return self.parse_raw(await self._client.download_raw(*request))
+
+    async def get_projected[R: tuple[Any, ...]](  # noqa: PLR0913
+        self,
+        projection: Projection[R],
+        *,
+        start: int | None = None,
+        n: int = 36,
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads browse series data and parses only the fields of a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            start: The starting index for pagination.
+            n: The number of results per page.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        request = _request(
+            start=start,
+            n=n,
+            sort_by=sort_by,
+            ratings=ratings,
+            locale=locale,
+        )
+        return projection.parse_raw(await self._client.download_raw(*request))
+
+    async def iter_pages(
+        self,
+        *,
+        n: int = 36,
+        locale: str = "en-US",
+        sort_by: str = "newly_added",
+        ratings: str = "true",
+        end_datetime: datetime | None = None,
+    ) -> AsyncIterator[models.BrowseSeries]:
+        """Yields browse pages as they arrive until end_date is reached (inclusive).
+
+        Args:
+            n: The number of results per page.
+            locale: The locale for the request.
+            sort_by: The sort order.
+            ratings: Whether to include ratings.
+            end_datetime: Stop when reaching this datetime.
+
+        Yields:
+            BrowseSeries pages.
+        """
+        end_datetime = end_datetime or datetime.now().astimezone()
+        start = 0
+
+        while True:
+            page = await self.get(
+                n=n,
+                locale=locale,
+                start=start,
+                sort_by=sort_by,
+                ratings=ratings,
+            )
+            yield page
+
+            if _is_last_page(page, n, end_datetime):
+                return
+
+            start += n
@@ -0,0 +1,244 @@
+"""Caches for responses downloaded from the Crunchyroll API."""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from rainbow_roll.routes import ROUTES
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
+# Browse results change constantly, while series and season metadata rarely changes.
+DEFAULT_TTLS = {
+    ROUTES["browse_series"].pattern: timedelta(minutes=5),
+    ROUTES["series"].pattern: timedelta(days=1),
+    ROUTES["seasons"].pattern: timedelta(days=1),
+    ROUTES["episodes"].pattern: timedelta(hours=6),
+}
+DEFAULT_TTL = timedelta(hours=1)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response body stored in the cache along with its validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    fresh: bool
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Returns the headers needed to revalidate the response with the server."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Stores raw API responses in a SQLite database.
+
+    Responses are keyed by endpoint and params, which includes the locale. Each
+    endpoint has its own time to live, after which the response is revalidated with
+    the server using its ETag or Last-Modified header when it had one.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        ttls: dict[str, timedelta] | None = None,
+        default_ttl: timedelta = DEFAULT_TTL,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: The path of the SQLite database, which is created if needed.
+            ttls: The time to live for endpoints that fully match each regex pattern,
+                defaults to ``DEFAULT_TTLS``.
+            default_ttl: The time to live for endpoints that do not match a pattern.
+        """
+        self.ttls = {
+            re.compile(pattern): ttl
+            for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        }
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+            "last_modified TEXT, stored_at REAL NOT NULL)",
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def key(endpoint: str, params: dict[str, Any]) -> str:
+        """Returns the cache key for a request."""
+        return f"{endpoint}?{json.dumps(params, sort_keys=True)}"
+
+    def ttl(self, endpoint: str) -> timedelta:
+        """Returns the time to live for responses from an endpoint."""
+        for pattern, ttl in self.ttls.items():
+            if pattern.fullmatch(endpoint):
+                return ttl
+        return self.default_ttl
+
+    def get(self, endpoint: str, params: dict[str, Any]) -> CachedResponse | None:
+        """Returns the cached response for a request, if there is one."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses "
+                "WHERE key = ?",
+                (self.key(endpoint, params),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body, etag, last_modified, stored_at = row
+        age = time.time() - stored_at
+        return CachedResponse(
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+            fresh=age < self.ttl(endpoint).total_seconds(),
+        )
+
+    def set(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        body: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Stores the response for a request."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (self.key(endpoint, params), body, etag, last_modified, time.time()),
+            )
+            self._connection.commit()
+
+    def touch(self, endpoint: str, params: dict[str, Any]) -> None:
+        """Marks a cached response as fresh after the server said it was unchanged."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?",
+                (time.time(), self.key(endpoint, params)),
+            )
+            self._connection.commit()
+
+    def delete(self, endpoint: str, params: dict[str, Any]) -> None:
+        """Removes the cached response for a request."""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ?",
+                (self.key(endpoint, params),),
+            )
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters for a ModelCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ModelCache[T]:
+    """A thread-safe, size bounded, least recently used cache of parsed models.
+
+    The cached models are shared between callers, so they should not be modified.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: timedelta | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The number of models to keep before evicting the least
+                recently used one.
+            ttl: How long a model is kept for, or forever if None.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached models."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> T | None:
+        """Returns the cached model for a key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                expires_at = entry[0] + self.ttl.total_seconds()
+                if expires_at <= time.monotonic():
+                    del self._entries[key]
+                    entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Caches a model, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes the cached model for a key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every cached model."""
+        with self._lock:
+            self._entries.clear()
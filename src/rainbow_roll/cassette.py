@@ -0,0 +1,116 @@
+"""Cassettes that record API responses so they can be replayed without a network."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from rainbow_roll.exceptions import CassetteMissError
+
+
+class Cassette:
+    """Records the responses downloaded by a client and replays them later.
+
+    A cassette is a gzip compressed JSON lines file with the endpoint, params,
+    headers, and body of every response. When recording, every downloaded response
+    is added to the cassette, which is saved when the client is closed. When
+    replaying, the whole cassette is held in memory and requests are answered from it
+    without authenticating or touching the network.
+    """
+
+    def __init__(self, path: Path | str, *, record: bool = False) -> None:
+        """Initialize the cassette.
+
+        Args:
+            path: The path of the cassette file. Existing responses are loaded from
+                it, and when recording they are kept unless they are downloaded again.
+            record: Whether to record responses instead of replaying them.
+        """
+        self.path = Path(path)
+        self.record = record
+        self._lock = threading.Lock()
+        self._interactions: dict[str, dict[str, Any]] = {}
+
+        if self.path.exists():
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    interaction = json.loads(line)
+                    key = self.key(
+                        interaction["endpoint"],
+                        interaction["params"],
+                        interaction["headers"],
+                    )
+                    self._interactions[key] = interaction
+
+        self._bodies = {
+            key: interaction["body"].encode()
+            for key, interaction in self._interactions.items()
+        }
+
+    def __len__(self) -> int:
+        """Returns the number of recorded responses."""
+        return len(self._interactions)
+
+    @staticmethod
+    def key(endpoint: str, params: dict[str, Any], headers: dict[str, str]) -> str:
+        """Returns the key that identifies a request in the cassette."""
+        return json.dumps([endpoint, params, headers], sort_keys=True)
+
+    def play(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+    ) -> bytes:
+        """Returns the recorded body of a request.
+
+        Raises:
+            CassetteMissError: If the request was not recorded.
+        """
+        try:
+            return self._bodies[self.key(endpoint, params, headers)]
+        except KeyError:
+            msg = f"Request was not recorded in {self.path}: {endpoint} {params}"
+            raise CassetteMissError(msg) from None
+
+    def add(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        body: bytes,
+    ) -> None:
+        """Records the body of a request, replacing any earlier recording of it."""
+        key = self.key(endpoint, params, headers)
+        interaction = {
+            "endpoint": endpoint,
+            "params": params,
+            "headers": headers,
+            "body": body.decode(),
+        }
+        with self._lock:
+            self._interactions[key] = interaction
+            self._bodies[key] = body
+
+    def save(self) -> None:
+        """Write the recorded responses, replacing the cassette file atomically."""
+        with self._lock:
+            lines = [
+                json.dumps(interaction, separators=(",", ":")) + "\n"
+                for interaction in self._interactions.values()
+            ]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with (
+            tempfile.NamedTemporaryFile(
+                dir=self.path.parent,
+                delete=False,
+            ) as temp_file,
+            gzip.open(temp_file, "wt", encoding="utf-8") as file,
+        ):
+            file.writelines(lines)
+        Path(temp_file.name).replace(self.path)
@@ -0,0 +1,307 @@
+"""A local SQLite catalog of parsed series, seasons, and episodes."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from rainbow_roll.browse_series import models as browse_series_models
+from rainbow_roll.episodes import models as episodes_models
+from rainbow_roll.seasons import models as seasons_models
+from rainbow_roll.series import models as series_models
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+type Response = (
+    browse_series_models.BrowseSeries
+    | series_models.Series
+    | seasons_models.Seasons
+    | episodes_models.Episodes
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    title TEXT,
+    last_public REAL,
+    data TEXT,
+    browse_data TEXT,
+    PRIMARY KEY (id, locale)
+);
+CREATE INDEX IF NOT EXISTS series_last_public ON series (locale, last_public);
+
+CREATE TABLE IF NOT EXISTS seasons (
+    id TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    series_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    season_sequence_number INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (id, locale)
+);
+CREATE INDEX IF NOT EXISTS seasons_series_id ON seasons (series_id, locale);
+
+CREATE TABLE IF NOT EXISTS episodes (
+    id TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    series_id TEXT NOT NULL,
+    season_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    sequence_number REAL NOT NULL,
+    availability_starts REAL NOT NULL,
+    episode_air_date REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (id, locale)
+);
+CREATE INDEX IF NOT EXISTS episodes_series_id ON episodes (series_id, locale);
+CREATE INDEX IF NOT EXISTS episodes_season_id ON episodes (season_id, locale);
+CREATE INDEX IF NOT EXISTS episodes_availability_starts
+    ON episodes (locale, availability_starts);
+CREATE INDEX IF NOT EXISTS episodes_episode_air_date
+    ON episodes (locale, episode_air_date);
+"""
+
+
+class Catalog:
+    """Stores parsed models in indexed SQLite tables so they can be queried locally.
+
+    Every object is stored once per locale. Timestamps are stored as seconds since
+    the epoch so they can be compared and indexed, and the full model is stored as
+    JSON so queries return the same models that were stored.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """Initialize the catalog.
+
+        Args:
+            path: The path of the SQLite database, which is created if needed.
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _upsert(self, sql: str, rows: Iterable[tuple[Any, ...]]) -> int:
+        """Runs an upsert for every row in a single transaction."""
+        with self._lock, self._connection:
+            return self._connection.executemany(sql, rows).rowcount
+
+    def _select[M: BaseModel](
+        self,
+        model: type[M],
+        sql: str,
+        parameters: tuple[Any, ...],
+    ) -> list[M]:
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [model.model_validate_json(data) for (data,) in rows]
+
+    def add(self, response: Response) -> int:
+        """Stores every entry of a response, using the locale it was requested in.
+
+        Args:
+            response: A BrowseSeries, Series, Seasons, or Episodes response.
+
+        Returns:
+            The number of entries that were stored.
+        """
+        locale = response.rainbow_roll.params.locale if response.rainbow_roll else None
+        locale = locale or "en-US"
+
+        if isinstance(response, browse_series_models.BrowseSeries):
+            return self.upsert_browse_series(response.data, locale=locale)
+        if isinstance(response, series_models.Series):
+            return self.upsert_series(response.data, locale=locale)
+        if isinstance(response, seasons_models.Seasons):
+            return self.upsert_seasons(response.data, locale=locale)
+        return self.upsert_episodes(response.data, locale=locale)
+
+    def upsert_series(
+        self,
+        series: Iterable[series_models.Datum],
+        *,
+        locale: str = "en-US",
+    ) -> int:
+        """Inserts or replaces series, returning the number that were stored."""
+        return self._upsert(
+            "INSERT INTO series (id, locale, title, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id, locale) DO UPDATE SET "
+            "title = excluded.title, data = excluded.data",
+            (
+                (entry.id, locale, entry.title, entry.model_dump_json(by_alias=True))
+                for entry in series
+            ),
+        )
+
+    def upsert_browse_series(
+        self,
+        entries: Iterable[browse_series_models.Datum],
+        *,
+        locale: str = "en-US",
+    ) -> int:
+        """Inserts or replaces browse entries, returning the number that were stored.
+
+        Browse entries are stored alongside the series data, and are the only source
+        of the ``last_public`` timestamp.
+        """
+        return self._upsert(
+            "INSERT INTO series (id, locale, title, last_public, browse_data) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (id, locale) DO UPDATE SET "
+            "title = coalesce(series.title, excluded.title), "
+            "last_public = excluded.last_public, browse_data = excluded.browse_data",
+            (
+                (
+                    entry.id,
+                    locale,
+                    entry.title,
+                    entry.last_public.timestamp(),
+                    entry.model_dump_json(by_alias=True),
+                )
+                for entry in entries
+            ),
+        )
+
+    def upsert_seasons(
+        self,
+        seasons: Iterable[seasons_models.Datum],
+        *,
+        locale: str = "en-US",
+    ) -> int:
+        """Inserts or replaces seasons, returning the number that were stored."""
+        return self._upsert(
+            "INSERT OR REPLACE INTO seasons VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    season.id,
+                    locale,
+                    season.series_id,
+                    season.title,
+                    season.season_sequence_number,
+                    season.model_dump_json(by_alias=True),
+                )
+                for season in seasons
+            ),
+        )
+
+    def upsert_episodes(
+        self,
+        episodes: Iterable[episodes_models.Datum],
+        *,
+        locale: str = "en-US",
+    ) -> int:
+        """Inserts or replaces episodes, returning the number that were stored."""
+        return self._upsert(
+            "INSERT OR REPLACE INTO episodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    episode.id,
+                    locale,
+                    episode.series_id,
+                    episode.season_id,
+                    episode.title,
+                    episode.sequence_number,
+                    episode.availability_starts.timestamp(),
+                    episode.episode_air_date.timestamp(),
+                    episode.model_dump_json(by_alias=True),
+                )
+                for episode in episodes
+            ),
+        )
+
+    def series(
+        self,
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> series_models.Datum | None:
+        """Returns a stored series, if it has been stored."""
+        result = self._select(
+            series_models.Datum,
+            "SELECT data FROM series WHERE id = ? AND locale = ? AND data IS NOT NULL",
+            (series_id, locale),
+        )
+        return result[0] if result else None
+
+    def series_updated_since(
+        self,
+        since: datetime,
+        *,
+        locale: str = "en-US",
+    ) -> list[browse_series_models.Datum]:
+        """Returns the browse entries made public at or after since, newest first."""
+        return self._select(
+            browse_series_models.Datum,
+            "SELECT browse_data FROM series WHERE locale = ? AND last_public >= ? "
+            "ORDER BY last_public DESC",
+            (locale, since.timestamp()),
+        )
+
+    def seasons_of(
+        self,
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[seasons_models.Datum]:
+        """Returns the stored seasons of a series in order."""
+        return self._select(
+            seasons_models.Datum,
+            "SELECT data FROM seasons WHERE series_id = ? AND locale = ? "
+            "ORDER BY season_sequence_number",
+            (series_id, locale),
+        )
+
+    def episodes_of(
+        self,
+        season_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[episodes_models.Datum]:
+        """Returns the stored episodes of a season in order."""
+        return self._select(
+            episodes_models.Datum,
+            "SELECT data FROM episodes WHERE season_id = ? AND locale = ? "
+            "ORDER BY sequence_number",
+            (season_id, locale),
+        )
+
+    def episodes_available_since(
+        self,
+        since: datetime,
+        *,
+        locale: str = "en-US",
+    ) -> list[episodes_models.Datum]:
+        """Returns the episodes that became available at or after since, in order."""
+        return self._select(
+            episodes_models.Datum,
+            "SELECT data FROM episodes WHERE locale = ? AND availability_starts >= ? "
+            "ORDER BY availability_starts",
+            (locale, since.timestamp()),
+        )
+
+    def episodes_aired_since(
+        self,
+        since: datetime,
+        *,
+        locale: str = "en-US",
+    ) -> list[episodes_models.Datum]:
+        """Returns the episodes that aired at or after since, in order."""
+        return self._select(
+            episodes_models.Datum,
+            "SELECT data FROM episodes WHERE locale = ? AND episode_air_date >= ? "
+            "ORDER BY episode_air_date",
+            (locale, since.timestamp()),
+        )
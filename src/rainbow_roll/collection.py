@@ -0,0 +1,136 @@
+"""Collections of parsed entries indexed by ID and by other fields."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+
+class IndexedEntries[T: BaseModel]:
+    """Entries keyed by ID, with secondary indexes on other fields.
+
+    Adding an entry whose ID is already present keeps whichever of the two is
+    fresher, so entries that show up on more than one page of a listing that shifted
+    while it was being paged through are only kept once. Entries are iterated in the
+    order their IDs were first added.
+
+    Secondary indexes map each value of a field to the entries with that value, and
+    are kept up to date as entries are added and replaced. Fields are given by name,
+    including nested fields such as ``series_metadata.is_mature``, and fields whose
+    value is a list index the entry under every item of the list.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[T] = (),
+        *,
+        indexes: Iterable[str] = (),
+        key: str = "id",
+        freshness: str | None = "last_public",
+    ) -> None:
+        """Initialize the collection.
+
+        Args:
+            entries: The entries to add.
+            indexes: The fields to build secondary indexes for.
+            key: The field that identifies an entry.
+            freshness: The field used to pick between two entries with the same ID,
+                the entry with the greater value is kept. When it is None, or either
+                entry does not have the field, the entry added last is kept.
+        """
+        self._key: Callable[[T], Hashable] = attrgetter(key)
+        self._freshness = freshness
+        self._entries: dict[Hashable, T] = {}
+        self._getters: dict[str, Callable[[T], Any]] = {
+            name: attrgetter(name) for name in indexes
+        }
+        self._indexes: dict[str, dict[Hashable, dict[Hashable, T]]] = {
+            name: {} for name in self._getters
+        }
+        self.update(entries)
+
+    def __len__(self) -> int:
+        """Returns the number of entries."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterates over the entries."""
+        return iter(self._entries.values())
+
+    def __contains__(self, entry_id: object) -> bool:
+        """Returns True if there is an entry with the ID."""
+        return entry_id in self._entries
+
+    def __getitem__(self, entry_id: Hashable) -> T:
+        """Returns the entry with the ID.
+
+        Raises:
+            KeyError: If there is no entry with the ID.
+        """
+        return self._entries[entry_id]
+
+    def get(self, entry_id: Hashable, default: T | None = None) -> T | None:
+        """Returns the entry with the ID, or default if there is none."""
+        return self._entries.get(entry_id, default)
+
+    def _is_fresher(self, entry: T, current: T) -> bool:
+        if self._freshness is None:
+            return True
+
+        new_value = getattr(entry, self._freshness, None)
+        current_value = getattr(current, self._freshness, None)
+        if new_value is None or current_value is None:
+            return True
+        return new_value >= current_value
+
+    def _index_values(self, name: str, entry: T) -> list[Hashable]:
+        value = self._getters[name](entry)
+        return list(value) if isinstance(value, list) else [value]
+
+    def add(self, entry: T) -> bool:
+        """Adds an entry, unless an entry with the same ID is fresher.
+
+        Returns:
+            True if the entry was added.
+        """
+        entry_id = self._key(entry)
+        current = self._entries.get(entry_id)
+        if current is not None:
+            if not self._is_fresher(entry, current):
+                return False
+            self._unindex(entry_id, current)
+
+        self._entries[entry_id] = entry
+        for name, index in self._indexes.items():
+            for value in self._index_values(name, entry):
+                index.setdefault(value, {})[entry_id] = entry
+        return True
+
+    def _unindex(self, entry_id: Hashable, entry: T) -> None:
+        for name, index in self._indexes.items():
+            for value in self._index_values(name, entry):
+                entries = index[value]
+                del entries[entry_id]
+                if not entries:
+                    del index[value]
+
+    def update(self, entries: Iterable[T]) -> int:
+        """Adds every entry, returning the number that were added."""
+        return sum(self.add(entry) for entry in entries)
+
+    def by(self, name: str, value: Hashable) -> list[T]:
+        """Returns the entries whose indexed field has the value.
+
+        Raises:
+            KeyError: If there is no index for the field.
+        """
+        return list(self._indexes[name].get(value, {}).values())
+
+    def values_of(self, name: str) -> list[Hashable]:
+        """Returns every value of an indexed field."""
+        return list(self._indexes[name])
@@ -0,0 +1,372 @@
+"""Crawlers that walk the browse, series, seasons, and episodes hierarchy."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+    from datetime import datetime
+
+    from pydantic import BaseModel
+
+    from rainbow_roll import RainbowRoll
+    from rainbow_roll.async_client import AsyncRainbowRoll
+    from rainbow_roll.episodes import models as episodes_models
+    from rainbow_roll.seasons import models as seasons_models
+    from rainbow_roll.series import models as series_models
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class SeasonNode:
+    """A season and all of its episodes."""
+
+    season: seasons_models.Datum
+    episodes: list[episodes_models.Datum] = field(default_factory=list)
+
+
+@dataclass
+class SeriesNode:
+    """A series and all of its seasons."""
+
+    id: str
+    series: series_models.Datum | None = None
+    seasons: list[SeasonNode] = field(default_factory=list)
+
+    def records(self) -> Iterator[CrawlRecord]:
+        """Yields the series, its seasons, and their episodes as flat records."""
+        if self.series is not None:
+            yield CrawlRecord("series", self.id, None, self.series)
+
+        for season_node in self.seasons:
+            season = season_node.season
+            yield CrawlRecord("season", season.id, self.id, season)
+            for episode in season_node.episodes:
+                yield CrawlRecord("episode", episode.id, season.id, episode)
+
+
+@dataclass(frozen=True)
+class CrawlRecord:
+    """A single crawled object with a reference to the object that contains it."""
+
+    kind: Literal["series", "season", "episode"]
+    id: str
+    parent_id: str | None
+    data: BaseModel
+
+
+@dataclass
+class CrawlProgress:
+    """Counters describing how far a crawl has progressed."""
+
+    series_total: int = 0
+    series_done: int = 0
+    seasons_done: int = 0
+    episodes_done: int = 0
+    requests: int = 0
+
+
+@dataclass
+class _CrawlState:
+    """The pending requests and seen seasons of a single crawl."""
+
+    executor: ThreadPoolExecutor
+    futures: dict[Future[Any], tuple[str, SeriesNode, SeasonNode | None]] = field(
+        default_factory=dict,
+    )
+    seen_seasons: set[str] = field(default_factory=set)
+
+
+class Crawler:
+    """Crawls series, seasons, and episodes concurrently using a thread pool."""
+
+    def __init__(
+        self,
+        client: RainbowRoll,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_per_host: int | None = None,
+        locale: str = "en-US",
+        progress: Callable[[CrawlProgress], None] | None = None,
+    ) -> None:
+        """Initialize the crawler.
+
+        Args:
+            client: The client used to make requests.
+            max_workers: The number of worker threads.
+            max_per_host: The maximum number of concurrent requests to a single host,
+                defaults to ``max_workers``.
+            locale: The locale for the requests.
+            progress: Called with the current progress after every request.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host or max_workers
+        self.locale = locale
+        self.progress = progress
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+
+    def _host_semaphore(self) -> threading.BoundedSemaphore:
+        with self._host_semaphores_lock:
+            if self.client.domain not in self._host_semaphores:
+                self._host_semaphores[self.client.domain] = threading.BoundedSemaphore(
+                    self.max_per_host,
+                )
+            return self._host_semaphores[self.client.domain]
+
+    def _fetch[T](self, get: Callable[..., T], object_id: str) -> T:
+        with self._host_semaphore():
+            return get(object_id, locale=self.locale)
+
+    def _submit(
+        self,
+        state: _CrawlState,
+        get: Callable[..., Any],
+        object_id: str,
+        target: tuple[str, SeriesNode, SeasonNode | None],
+    ) -> None:
+        future = state.executor.submit(self._fetch, get, object_id)
+        state.futures[future] = target
+
+    def _add_seasons(
+        self,
+        state: _CrawlState,
+        node: SeriesNode,
+        seasons: seasons_models.Seasons,
+    ) -> int:
+        """Adds the unseen seasons to the node and queues their episodes."""
+        added = 0
+        for season in seasons.data:
+            if season.id in state.seen_seasons:
+                continue
+            state.seen_seasons.add(season.id)
+            season_node = SeasonNode(season)
+            node.seasons.append(season_node)
+            self._submit(
+                state,
+                self.client.episodes.get,
+                season.id,
+                ("episodes", node, season_node),
+            )
+            added += 1
+        return added
+
+    def crawl(self, series_ids: Iterable[str]) -> Iterator[SeriesNode]:
+        """Crawls the given series, yielding each one once it has been fully fetched.
+
+        Duplicate series IDs, and seasons shared between series, are only fetched
+        once. Series are yielded in the order they finish, not the order they were
+        given in. Each crawl has its own thread pool, so a crawler can run several
+        crawls at once.
+        """
+        ids = list(dict.fromkeys(series_ids))
+        progress = CrawlProgress(series_total=len(ids))
+        # The number of requests that still have to finish for each series.
+        outstanding = dict.fromkeys(ids, 2)
+        state = _CrawlState(ThreadPoolExecutor(max_workers=self.max_workers))
+
+        try:
+            for series_id in ids:
+                node = SeriesNode(series_id)
+                series_target = ("series", node, None)
+                seasons_target = ("seasons", node, None)
+                self._submit(state, self.client.series.get, node.id, series_target)
+                self._submit(state, self.client.seasons.get, node.id, seasons_target)
+
+            while state.futures:
+                done, _ = wait(state.futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, node, season_node = state.futures.pop(future)
+                    result = future.result()
+                    progress.requests += 1
+                    outstanding[node.id] -= 1
+
+                    if kind == "series":
+                        node.series = result.data[0] if result.data else None
+                    elif kind == "seasons":
+                        outstanding[node.id] += self._add_seasons(state, node, result)
+                    elif season_node is not None:
+                        season_node.episodes = result.data
+                        progress.seasons_done += 1
+                        progress.episodes_done += len(result.data)
+
+                    if outstanding[node.id] == 0:
+                        progress.series_done += 1
+
+                    if self.progress:
+                        self.progress(progress)
+
+                    if outstanding[node.id] == 0:
+                        yield node
+        finally:
+            state.executor.shutdown(wait=False, cancel_futures=True)
+
+    def crawl_since(
+        self,
+        end_datetime: datetime | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[SeriesNode]:
+        """Crawls every series on the browse pages until end_datetime is reached.
+
+        Args:
+            end_datetime: Passed to ``BrowseSeries.get_since_datetime()``.
+            **kwargs: Passed to ``BrowseSeries.get_since_datetime()``.
+        """
+        pages = self.client.browse_series.get_since_datetime(
+            end_datetime=end_datetime,
+            locale=self.locale,
+            **kwargs,
+        )
+        entries = self.client.browse_series.indexed_entries(pages, indexes=())
+        return self.crawl(entry.id for entry in entries)
+
+    def crawl_records(self, series_ids: Iterable[str]) -> Iterator[CrawlRecord]:
+        """Crawls the given series, yielding flat records instead of a tree."""
+        for node in self.crawl(series_ids):
+            yield from node.records()
+
+
+class AsyncCrawler:
+    """Crawls series, seasons, and episodes concurrently using asyncio."""
+
+    def __init__(
+        self,
+        client: AsyncRainbowRoll,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_per_host: int | None = None,
+        locale: str = "en-US",
+        progress: Callable[[CrawlProgress], None] | None = None,
+    ) -> None:
+        """Initialize the crawler.
+
+        Args:
+            client: The client used to make requests.
+            max_workers: The maximum number of concurrent requests.
+            max_per_host: The maximum number of concurrent requests to a single host,
+                defaults to ``max_workers``.
+            locale: The locale for the requests.
+            progress: Called with the current progress after every request.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host or max_workers
+        self.locale = locale
+        self.progress = progress
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._workers = asyncio.Semaphore(max_workers)
+
+    def _host_semaphore(self) -> asyncio.Semaphore:
+        if self.client.domain not in self._host_semaphores:
+            self._host_semaphores[self.client.domain] = asyncio.Semaphore(
+                self.max_per_host,
+            )
+        return self._host_semaphores[self.client.domain]
+
+    async def _fetch(
+        self,
+        progress: CrawlProgress,
+        get: Callable[..., Any],
+        object_id: str,
+    ) -> Any:  # noqa: ANN401
+        async with self._workers, self._host_semaphore():
+            result = await get(object_id, locale=self.locale)
+
+        progress.requests += 1
+        if self.progress:
+            self.progress(progress)
+
+        return result
+
+    async def _crawl_series(
+        self,
+        series_id: str,
+        seen_seasons: set[str],
+        progress: CrawlProgress,
+    ) -> SeriesNode:
+        series, seasons = await asyncio.gather(
+            self._fetch(progress, self.client.series.get, series_id),
+            self._fetch(progress, self.client.seasons.get, series_id),
+        )
+        node = SeriesNode(series_id, series.data[0] if series.data else None)
+
+        for season in seasons.data:
+            if season.id not in seen_seasons:
+                seen_seasons.add(season.id)
+                node.seasons.append(SeasonNode(season))
+
+        episodes = await asyncio.gather(
+            *(
+                self._fetch(progress, self.client.episodes.get, season_node.season.id)
+                for season_node in node.seasons
+            ),
+        )
+        for season_node, result in zip(node.seasons, episodes, strict=True):
+            season_node.episodes = result.data
+            progress.seasons_done += 1
+            progress.episodes_done += len(result.data)
+
+        progress.series_done += 1
+        return node
+
+    async def crawl(self, series_ids: Iterable[str]) -> AsyncIterator[SeriesNode]:
+        """Crawls the given series, yielding each one once it has been fully fetched.
+
+        Duplicate series IDs, and seasons shared between series, are only fetched
+        once. Series are yielded in the order they finish, not the order they were
+        given in.
+        """
+        ids = list(dict.fromkeys(series_ids))
+        progress = CrawlProgress(series_total=len(ids))
+        seen_seasons: set[str] = set()
+        tasks = [
+            asyncio.create_task(self._crawl_series(series_id, seen_seasons, progress))
+            for series_id in ids
+        ]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def crawl_since(
+        self,
+        end_datetime: datetime | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[SeriesNode]:
+        """Crawls every series on the browse pages until end_datetime is reached.
+
+        Args:
+            end_datetime: Passed to ``AsyncBrowseSeries.iter_pages()``.
+            **kwargs: Passed to ``AsyncBrowseSeries.iter_pages()``.
+        """
+        series_ids = [
+            entry.id
+            async for page in self.client.browse_series.iter_pages(
+                end_datetime=end_datetime,
+                locale=self.locale,
+                **kwargs,
+            )
+            for entry in page.data
+        ]
+
+        async for node in self.crawl(series_ids):
+            yield node
+
+    async def crawl_records(
+        self,
+        series_ids: Iterable[str],
+    ) -> AsyncIterator[CrawlRecord]:
+        """Crawls the given series, yielding flat records instead of a tree."""
+        async for node in self.crawl(series_ids):
+            for record in node.records():
+                yield record
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 
-from rainbow_roll.base_api_endpoint import BaseEndpoint
+from rainbow_roll.base_api_endpoint import AsyncBaseEndpoint, BaseEndpoint, Request
 from rainbow_roll.episodes import models
 
+if TYPE_CHECKING:
+    from rainbow_roll.projection import Projection
+
+
+def _request(series_id: str, locale: str) -> Request:
+    # This referer is valid, but it's not the ideal one because the real one would
+    # include the series slug at the end as well.
+    headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
+    endpoint = f"content/v2/cms/seasons/{series_id}/episodes"
+    params = {"locale": locale}
+    return Request(endpoint, params, headers)
+
 
 class Episodes(BaseEndpoint[models.Episodes]):
     """Provides methods to download, parse, and retrieve episodes data."""
@@ -32,21 +44,78 @@ class Episodes(BaseEndpoint[models.Episodes]):
         Returns:
             The raw JSON response as a dict, suitable for passing to ``parse()``.
         """
-        # This referer is valid, but it's not the ideal one because the real one would
-        # include the series slug at the end as well.
-        headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
-        endpoint = f"content/v2/cms/seasons/{series_id}/episodes"
-        params = {"locale": locale}
-        return self._client.download(
-            endpoint=endpoint,
-            params=params,
-            headers=headers,
-        )
+        return self._client.download(*_request(series_id, locale))
 
     def get(self, series_id: str, *, locale: str = "en-US") -> models.Episodes:
         """Downloads and parses episodes data for a given season ID.
 
-        Convenience method that calls ``download()`` then ``parse()``.
+        Convenience method that downloads the response and parses it with
+        ``parse_raw()``. The result is served from the endpoint's model cache when it
+        is enabled.
+
+        Args:
+            series_id: The season ID to get episodes for.
+            locale: The locale for the request.
+
+        Returns:
+            An Episodes model containing the parsed data.
+        """
+        return self._cached_get(
+            (series_id, locale),
+            lambda: self.parse_raw(
+                self._client.download_raw(*_request(series_id, locale)),
+            ),
+        )
+
+    def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads episodes data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The season ID to get episodes for.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        return projection.parse_raw(
+            self._client.download_raw(*_request(series_id, locale)),
+        )
+
+
+class AsyncEpisodes(AsyncBaseEndpoint[models.Episodes]):
+    """Provides async methods to download, parse, and retrieve episodes data."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.Episodes]:
+        return models.Episodes
+
+    async def download(
+        self,
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads episodes data for a given season ID.
+
+        Args:
+            series_id: The season ID to get episodes for.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        return await self._client.download(*_request(series_id, locale))
+
+    async def get(self, series_id: str, *, locale: str = "en-US") -> models.Episodes:
+        """Downloads and parses episodes data for a given season ID.
 
         Args:
             series_id: The season ID to get episodes for.
@@ -55,5 +124,25 @@ class Episodes(BaseEndpoint[models.Episodes]):
         Returns:
             An Episodes model containing the parsed data.
         """
-        data = self.download(series_id, locale=locale)
-        return self.parse(data)
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return self.parse_raw(response)
+
+    async def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads episodes data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The season ID to get episodes for.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return projection.parse_raw(response)
@@ -7,3 +7,7 @@ class RainbowRollError(Exception):
 
 class HTTPError(RainbowRollError):
     """Raised when HTTP request fails with unexpected status code."""
+
+
+class CassetteMissError(RainbowRollError):
+    """Raised when a replayed request was not recorded in the cassette."""
@@ -0,0 +1,195 @@
+"""Columnar export of parsed models to Arrow and Parquet.
+
+This module requires the optional ``pyarrow`` dependency, which can be installed with
+the ``arrow`` extra.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import cached_property
+from itertools import batched
+from operator import attrgetter
+from types import NoneType, UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pydantic import AwareDatetime, BaseModel
+from pydantic_core import to_json
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+
+DEFAULT_CHUNK_SIZE = 10_000
+# Low cardinality string columns that are dictionary encoded along with locales.
+DICTIONARY_COLUMNS = frozenset(
+    {"type", "media_type", "channel_id", "availability_status", "eligible_region"},
+)
+
+_SCALAR_TYPES: dict[Any, pa.DataType] = {
+    str: pa.string(),
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    NoneType: pa.null(),
+    # Timestamps are stored as int64 microseconds since the epoch.
+    AwareDatetime: pa.timestamp("us", tz="UTC"),
+    datetime: pa.timestamp("us", tz="UTC"),
+}
+
+
+def _unwrap_optional(annotation: Any) -> Any:  # noqa: ANN401
+    """Returns the annotation without None if it is an optional type."""
+    if get_origin(annotation) in {Union, UnionType}:
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_dictionary(name: str) -> bool:
+    return "locale" in name or name in DICTIONARY_COLUMNS
+
+
+def _arrow_type(name: str, annotation: Any) -> pa.DataType | None:  # noqa: ANN401
+    """Returns the Arrow type of a column, or None if it is stored as JSON."""
+    annotation = _unwrap_optional(annotation)
+
+    if get_origin(annotation) is list:
+        (item_annotation,) = get_args(annotation)
+        item_type = _arrow_type(name, item_annotation)
+        return pa.list_(item_type) if item_type else None
+
+    arrow_type = _SCALAR_TYPES.get(annotation)
+    if arrow_type == pa.string() and _is_dictionary(name):
+        return pa.dictionary(pa.int32(), pa.string())
+    return arrow_type
+
+
+class ColumnarExporter[M: BaseModel]:
+    """Flattens models into typed Arrow record batches and writes them to files.
+
+    Nested models are flattened into columns named with their dotted path, such as
+    ``extended_maturity_rating.rating``. Lists of scalars become list columns, and
+    anything that cannot be typed, such as lists of models, is stored as JSON text.
+    Locales and other low cardinality strings are dictionary encoded.
+    """
+
+    def __init__(self, model: type[M]) -> None:
+        """Initialize the exporter with the model that will be exported."""
+        self.model = model
+
+    @cached_property
+    def schema(self) -> pa.Schema:
+        """The Arrow schema of the exported columns."""
+        return pa.schema(self._fields(self.model, ""))
+
+    def _fields(self, model: type[BaseModel], prefix: str) -> list[pa.Field]:
+        fields: list[pa.Field] = []
+        for name, field in model.model_fields.items():
+            annotation = _unwrap_optional(field.annotation)
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                fields.extend(self._fields(annotation, f"{prefix}{name}."))
+            else:
+                arrow_type = _arrow_type(name, field.annotation) or pa.string()
+                fields.append(pa.field(prefix + name, arrow_type))
+        return fields
+
+    def _columns(
+        self,
+        model: type[BaseModel],
+        objects: list[Any],
+    ) -> Iterator[list[Any]]:
+        """Yields the values of each column, in the same order as the schema."""
+        has_none = any(obj is None for obj in objects)
+        for name, field in model.model_fields.items():
+            if has_none:
+                values = [obj and getattr(obj, name) for obj in objects]
+            else:
+                values = list(map(attrgetter(name), objects))
+            annotation = _unwrap_optional(field.annotation)
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                yield from self._columns(annotation, values)
+            elif _arrow_type(name, field.annotation) is None:
+                yield [
+                    None if value is None else to_json(value).decode()
+                    for value in values
+                ]
+            else:
+                yield values
+
+    def record_batch(self, models: Sequence[M]) -> pa.RecordBatch:
+        """Converts models into a single record batch."""
+        columns = [
+            pa.array(values, type=field.type)
+            for values, field in zip(
+                self._columns(self.model, list(models)),
+                self.schema,
+                strict=True,
+            )
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=self.schema)
+
+    def record_batches(
+        self,
+        models: Iterable[M],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[pa.RecordBatch]:
+        """Yields record batches of at most chunk_size models each."""
+        for chunk in batched(models, chunk_size, strict=False):
+            yield self.record_batch(chunk)
+
+    def write_parquet(
+        self,
+        models: Iterable[M],
+        path: Path | str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression: str = "zstd",
+    ) -> int:
+        """Writes models to a Parquet file one chunk at a time.
+
+        Only a single chunk is held in memory at once, so models can be streamed from
+        a generator.
+
+        Args:
+            models: The models to write.
+            path: The path of the Parquet file.
+            chunk_size: The number of models in each row group.
+            compression: The compression codec.
+
+        Returns:
+            The number of rows written.
+        """
+        rows = 0
+        with pq.ParquetWriter(path, self.schema, compression=compression) as writer:
+            for batch in self.record_batches(models, chunk_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+
+    def write_ipc(
+        self,
+        models: Iterable[M],
+        path: Path | str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Writes models to an Arrow IPC file one chunk at a time.
+
+        Args:
+            models: The models to write.
+            path: The path of the Arrow IPC file.
+            chunk_size: The number of models in each record batch.
+
+        Returns:
+            The number of rows written.
+        """
+        rows = 0
+        with pa.ipc.new_file(path, self.schema) as writer:
+            for batch in self.record_batches(models, chunk_size):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
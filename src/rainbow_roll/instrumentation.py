@@ -0,0 +1,348 @@
+"""Events describing the work done by a client, and metrics aggregated from them."""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+from rainbow_roll.routes import route
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+@dataclass(frozen=True)
+class RequestStarted:
+    """Emitted before an API request is made."""
+
+    endpoint: str
+    url: str
+    params: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class RequestFinished:
+    """Emitted after an API request has finished, whether or not it succeeded.
+
+    Attributes:
+        endpoint: The API endpoint that was requested.
+        url: The full URL that was requested.
+        params: The query params of the request.
+        status: The status of the last response, or None if the body was not
+            downloaded from the API.
+        source: Where the body came from, the network, the response cache, or a
+            cassette.
+        elapsed: The total number of seconds spent on the request, including
+            authentication and retries.
+        connect_time: The number of seconds spent opening a connection for the last
+            attempt, including the DNS lookup and TLS handshake, or 0 if a pooled
+            connection was reused. None when it is not known.
+        time_to_first_byte: The number of seconds from sending the last attempt until
+            its headers were received. None when it is not known.
+        download_time: The number of seconds spent receiving the body of the last
+            attempt. None when it is not known.
+        size: The number of bytes in the response body, 0 if the request failed.
+        retries: The number of times the request was retried.
+        error: The name of the exception the request failed with, or None if it
+            succeeded.
+    """
+
+    endpoint: str
+    url: str
+    params: dict[str, Any]
+    status: int | None
+    source: Literal["network", "cache", "cassette"]
+    elapsed: float
+    connect_time: float | None
+    time_to_first_byte: float | None
+    download_time: float | None
+    size: int
+    retries: int
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class TokenRefreshed:
+    """Emitted after a public or access token has been downloaded."""
+
+    kind: Literal["public", "access"]
+    elapsed: float
+
+
+@dataclass(frozen=True)
+class ResponseParsed:
+    """Emitted after a response has been parsed into a model."""
+
+    model: str
+    elapsed: float
+
+
+type Event = RequestStarted | RequestFinished | TokenRefreshed | ResponseParsed
+type Listener = Callable[[Event], None]
+
+
+@dataclass
+class Histogram:
+    """Counts observations in cumulative buckets, like a Prometheus histogram."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Create a count for each bucket, and one for values above every bucket."""
+        self.counts = self.counts or [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Returns the number of values less than or equal to each bucket."""
+        running = 0
+        result: list[tuple[float, int]] = []
+        for bucket, count in zip(
+            (*self.buckets, float("inf")),
+            self.counts,
+            strict=True,
+        ):
+            running += count
+            result.append((bucket, running))
+        return result
+
+
+type Labels = tuple[tuple[str, str], ...]
+
+
+def _bucket_label(bucket: float) -> str:
+    return "+Inf" if bucket == float("inf") else str(bucket)
+
+
+class Metrics:
+    """Aggregates events into counters and histograms.
+
+    Every metric is keyed by its name and labels, and can be exported as a dict or in
+    the Prometheus text format.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize the metrics.
+
+        Args:
+            buckets: The upper bounds of the histogram buckets, in seconds.
+        """
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Add a value to a counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counter = self.counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add a value to a histogram."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            histograms = self.histograms.setdefault(name, {})
+            if key not in histograms:
+                histograms[key] = Histogram(self.buckets)
+            histograms[key].observe(value)
+
+    def record(self, event: Event) -> None:
+        """Update the metrics with an event."""
+        if isinstance(event, RequestFinished):
+            # Endpoints are labelled by route so that metrics are not split by ID.
+            name = route(event.endpoint) or event.endpoint
+            status = "" if event.status is None else str(event.status)
+            self.increment(
+                "rainbow_roll_requests_total",
+                route=name,
+                source=event.source,
+                status=status,
+            )
+            if event.error is not None:
+                self.increment(
+                    "rainbow_roll_request_errors_total",
+                    route=name,
+                    error=event.error,
+                )
+            self.increment("rainbow_roll_retries_total", event.retries, route=name)
+            self.increment("rainbow_roll_response_bytes_total", event.size, route=name)
+            self.observe("rainbow_roll_request_seconds", event.elapsed, route=name)
+            if event.connect_time is not None:
+                self.observe(
+                    "rainbow_roll_connect_seconds",
+                    event.connect_time,
+                    route=name,
+                )
+            if event.time_to_first_byte is not None:
+                self.observe(
+                    "rainbow_roll_time_to_first_byte_seconds",
+                    event.time_to_first_byte,
+                    route=name,
+                )
+            if event.download_time is not None:
+                self.observe(
+                    "rainbow_roll_download_seconds",
+                    event.download_time,
+                    route=name,
+                )
+        elif isinstance(event, TokenRefreshed):
+            self.increment("rainbow_roll_token_refreshes_total", kind=event.kind)
+            self.observe(
+                "rainbow_roll_token_refresh_seconds",
+                event.elapsed,
+                kind=event.kind,
+            )
+        elif isinstance(event, ResponseParsed):
+            self.observe("rainbow_roll_parse_seconds", event.elapsed, model=event.model)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns every counter and histogram as JSON compatible data."""
+        with self._lock:
+            counters = {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in counter.items()
+                ]
+                for name, counter in self.counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "buckets": {
+                            _bucket_label(bucket): count
+                            for bucket, count in histogram.cumulative()
+                        },
+                        "sum": histogram.total,
+                        "count": histogram.count,
+                    }
+                    for key, histogram in values.items()
+                ]
+                for name, values in self.histograms.items()
+            }
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Returns every counter and histogram in the Prometheus text format."""
+
+        def labels(key: Labels, **extra: str) -> str:
+            pairs = [*key, *extra.items()]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+        lines: list[str] = []
+        with self._lock:
+            for name, counter in self.counters.items():
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(
+                    f"{name}{labels(key)} {value}" for key, value in counter.items()
+                )
+
+            for name, histograms in self.histograms.items():
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in histograms.items():
+                    for bucket, count in histogram.cumulative():
+                        le = _bucket_label(bucket)
+                        lines.append(f"{name}_bucket{labels(key, le=le)} {count}")
+                    lines.append(f"{name}_sum{labels(key)} {histogram.total}")
+                    lines.append(f"{name}_count{labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class Instrumentation:
+    """Sends the events of a client to listeners and aggregates them into metrics.
+
+    Listeners are called synchronously on the thread that did the work, so they
+    should be quick and must not raise.
+    """
+
+    def __init__(self, *listeners: Listener, metrics: Metrics | None = None) -> None:
+        """Initialize the instrumentation.
+
+        Args:
+            listeners: Callables that are passed every event.
+            metrics: The metrics the events are aggregated into.
+        """
+        self.metrics = metrics or Metrics()
+        self._listeners = list(listeners)
+
+    def add_listener(self, listener: Listener) -> None:
+        """Pass every future event to a listener."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """Stop passing events to a listener."""
+        self._listeners.remove(listener)
+
+    def emit(self, event: Event) -> None:
+        """Record an event and pass it to every listener."""
+        self.metrics.record(event)
+        for listener in self._listeners:
+            listener(event)
+
+
+@dataclass
+class RequestTrace:
+    """The details of a request that are filled in while it is being made."""
+
+    started: float = field(default_factory=time.perf_counter)
+    status: int | None = None
+    source: Literal["network", "cache", "cassette"] = "network"
+    connect_time: float | None = None
+    time_to_first_byte: float | None = None
+    download_time: float | None = None
+    retries: int = 0
+
+    def response(
+        self,
+        status: int,
+        *,
+        connect_time: float | None = None,
+        time_to_first_byte: float | None = None,
+        download_time: float | None = None,
+    ) -> None:
+        """Record the response to an attempt and how long each phase of it took."""
+        self.status = status
+        self.connect_time = connect_time
+        self.time_to_first_byte = time_to_first_byte
+        self.download_time = download_time
+
+    def finished(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        body: bytes = b"",
+        error: BaseException | None = None,
+    ) -> RequestFinished:
+        """Returns the event for the finished request, or the one that failed."""
+        return RequestFinished(
+            endpoint=endpoint,
+            url=url,
+            params=params,
+            status=self.status,
+            source=self.source,
+            elapsed=time.perf_counter() - self.started,
+            connect_time=self.connect_time,
+            time_to_first_byte=self.time_to_first_byte,
+            download_time=self.download_time,
+            size=len(body),
+            retries=self.retries,
+            error=None if error is None else type(error).__name__,
+        )
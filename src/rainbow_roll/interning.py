@@ -0,0 +1,130 @@
+"""Interning of the values that repeat across many parsed models."""
+
+from __future__ import annotations
+
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from rainbow_roll.profiling import has_model
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Fields with a small set of values that repeat across the entries of every response.
+DEFAULT_INTERNED_FIELDS = frozenset(
+    {
+        "audio_locale",
+        "audio_locales",
+        "availability_status",
+        "channel_id",
+        "content_descriptors",
+        "eligible_region",
+        "force_locale",
+        "level",
+        "locale",
+        "maturity_ratings",
+        "media_type",
+        "rating",
+        "recent_audio_locale",
+        "recent_variant",
+        "roles",
+        "season_tags",
+        "subtitle_locales",
+        "system",
+        "tenant_categories",
+        "type",
+        "variant",
+    },
+)
+
+# The number of distinct lists that are pooled before new lists stop being shared.
+DEFAULT_MAX_LISTS = 10_000
+
+
+class Interner:
+    """Replaces repeated values in parsed models with a single shared copy.
+
+    Strings in the interned fields are replaced with ``sys.intern()`` copies, and
+    lists of strings with a list from a pool that is shared by every model with the
+    same values. A large catalog held in memory then keeps one copy of each locale,
+    rating, or list of subtitle locales instead of one for every entry. Shared lists
+    must be treated as read-only, since changing one changes it in every model.
+
+    The pool of lists lives as long as the interner and is capped at ``max_lists``
+    distinct lists. Once it is full, lists that are not already pooled are left as
+    they are, so interning fields with many distinct values cannot grow it without
+    bound.
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[str] = DEFAULT_INTERNED_FIELDS,
+        max_lists: int = DEFAULT_MAX_LISTS,
+    ) -> None:
+        """Initialize the interner.
+
+        Args:
+            fields: The names of the fields to intern in every model.
+            max_lists: The largest number of distinct lists to pool.
+        """
+        self.fields = frozenset(fields)
+        self.max_lists = max_lists
+        self._plan = cache(self._plan_for)
+        self._lists: dict[tuple[str, ...], list[str]] = {}
+
+    def _plan_for(self, model: type[BaseModel]) -> tuple[list[str], list[str]]:
+        """Returns the fields of a model to intern and the fields with nested models."""
+        interned: list[str] = []
+        nested: list[str] = []
+        for name, field in model.model_fields.items():
+            if has_model(field.annotation):
+                nested.append(name)
+            elif name in self.fields:
+                interned.append(name)
+        return interned, nested
+
+    def _shared_list(self, value: list[Any]) -> list[Any]:
+        """Returns the pooled list with the same strings as value."""
+        if not all(isinstance(item, str) for item in value):
+            return value
+
+        key = tuple(value)
+        if (shared := self._lists.get(key)) is not None:
+            return shared
+        if len(self._lists) >= self.max_lists:
+            return value
+        return self._lists.setdefault(key, [sys.intern(item) for item in value])
+
+    def _walk(self, value: object) -> None:
+        if isinstance(value, BaseModel):
+            self.intern(value)
+        elif isinstance(value, list):
+            for item in value:
+                self._walk(item)
+
+    def intern[T: BaseModel](self, model: T) -> T:
+        """Interns the strings of a model and of every model nested in it.
+
+        Args:
+            model: The model to update in place.
+
+        Returns:
+            The same model.
+        """
+        interned, nested = self._plan(type(model))
+        values = model.__dict__
+
+        for name in interned:
+            value = values[name]
+            if isinstance(value, str):
+                values[name] = sys.intern(value)
+            elif isinstance(value, list):
+                values[name] = self._shared_list(value)
+
+        for name in nested:
+            self._walk(values[name])
+
+        return model
@@ -0,0 +1,165 @@
+"""Lazy validation of the entries in parsed responses."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING, Any, Self, SupportsIndex, cast, get_args, get_origin
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+class LazyEntries[M: BaseModel](list[M]):
+    """A list of entries that are each validated the first time they are accessed.
+
+    The raw entries are kept in the list and replaced with their models as they are
+    read, so a response whose entries are only partly used never pays to validate
+    the rest. Entries that do not match the model raise ``ValidationError`` when
+    they are accessed instead of when the response is parsed.
+
+    pydantic serializes lists without going through Python, so ``materialize()``
+    must be called before a response with unread entries is dumped.
+    """
+
+    def __init__(
+        self,
+        model: type[M],
+        entries: Iterable[dict[str, Any]],
+        on_validate: Callable[[M], object] | None = None,
+    ) -> None:
+        """Initialize the list.
+
+        Args:
+            model: The model of each entry.
+            entries: The raw JSON data of each entry.
+            on_validate: Called with every entry after it is validated.
+        """
+        super().__init__(cast("Iterable[M]", entries))
+        self.model = model
+        self.on_validate = on_validate
+
+    def _entry(self, index: int) -> M:
+        entry: M | dict[str, Any] = super().__getitem__(index)
+        if isinstance(entry, dict):
+            entry = self.model.model_validate(entry)
+            if self.on_validate is not None:
+                self.on_validate(entry)
+            super().__setitem__(index, entry)
+        return entry
+
+    def materialize(self) -> Self:
+        """Validates every entry that has not been accessed yet."""
+        for index in range(len(self)):
+            self._entry(index)
+        return self
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:  # noqa: ANN401
+        """Returns the entry, or a list of the entries, at the index."""
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        return self._entry(index.__index__())
+
+    def __iter__(self) -> Iterator[M]:
+        """Yields every entry, validating them as they are reached."""
+        for index in range(len(self)):
+            yield self._entry(index)
+
+    def __reversed__(self) -> Iterator[M]:
+        """Yields every entry in reverse, validating them as they are reached."""
+        for index in reversed(range(len(self))):
+            yield self._entry(index)
+
+    def __contains__(self, value: object) -> bool:
+        """Returns True if an entry is equal to value."""
+        self.materialize()
+        return super().__contains__(value)
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True if the entries are equal to other."""
+        self.materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Returns True if the entries are not equal to other."""
+        self.materialize()
+        return super().__ne__(other)
+
+    # Lists are mutable, so they are not hashable.
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Returns the representation of the validated entries."""
+        self.materialize()
+        return super().__repr__()
+
+    def __add__(self, other: list[M]) -> list[M]:  # type: ignore[override]
+        """Returns a list of the entries followed by other."""
+        return list(self) + other
+
+    def copy(self) -> list[M]:
+        """Returns a list of the entries."""
+        return list(self)
+
+    def index(self, value: M, *args: SupportsIndex) -> int:
+        """Returns the position of the first entry that is equal to value."""
+        self.materialize()
+        return super().index(value, *args)
+
+    def count(self, value: M) -> int:
+        """Returns the number of entries that are equal to value."""
+        self.materialize()
+        return super().count(value)
+
+    def pop(self, index: SupportsIndex = -1) -> M:
+        """Removes and returns the entry at the index."""
+        entry = self._entry(index.__index__())
+        super().pop(index)
+        return entry
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Sorts the entries in place."""
+        self.materialize()
+        super().sort(*args, **kwargs)
+
+
+@cache
+def _entry_model(model: type[BaseModel]) -> type[BaseModel] | None:
+    """Returns the model of the entries in a response's data list, if it has one."""
+    if (field := model.model_fields.get("data")) is None:
+        return None
+    if get_origin(field.annotation) is not list:
+        return None
+    (entry,) = get_args(field.annotation)
+    if isinstance(entry, type) and issubclass(entry, BaseModel):
+        return entry
+    return None
+
+
+def validate_lazily[T: BaseModel](
+    model: type[T],
+    data: dict[str, Any],
+    on_validate: Callable[[BaseModel], object] | None = None,
+) -> T | None:
+    """Validates a response except for its entries, which are validated lazily.
+
+    Args:
+        model: The model of the response.
+        data: The raw JSON data for the response.
+        on_validate: Called with the response and with every entry after they are
+            validated.
+
+    Returns:
+        The response with a ``LazyEntries`` list of entries, or None if the model or
+        the data does not have a list of entries.
+    """
+    entry_model = _entry_model(model)
+    if entry_model is None or not isinstance(entries := data.get("data"), list):
+        return None
+
+    response = model.model_validate({**data, "data": []})
+    if on_validate is not None:
+        on_validate(response)
+    response.__dict__["data"] = LazyEntries(entry_model, entries, on_validate)
+    return response
@@ -0,0 +1,381 @@
+"""A local stand-in for the Crunchyroll API that serves saved responses.
+
+The server answers the token, browse, series, seasons, episodes, and objects
+endpoints with the responses saved in the ``_files`` folders, and can inject latency,
+server errors, and throttling so clients can be load tested offline::
+
+    python -m rainbow_roll.mock_server --port 8080 --latency 0.05 --throttle-rate 0.1
+
+Clients can also use it in-process, without a server, through ``MockAdapter``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Self, override
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rainbow_roll.routes import route
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+    from rainbow_roll import RainbowRoll
+    from rainbow_roll.async_client import AsyncRainbowRoll
+
+BUNDLE_JS = 'prod="mock-client-id:mock-client-secret"'
+TOKEN_LIFETIME = 300
+
+type Response = tuple[int, dict[str, str], bytes]
+
+
+@dataclass(frozen=True)
+class FaultConfig:
+    """Controls the latency and failures injected into responses.
+
+    Attributes:
+        latency: The number of seconds to wait before every response.
+        jitter: Up to this many extra seconds are added to the latency at random.
+        error_rate: The fraction of API requests that fail with a 503.
+        throttle_rate: The fraction of API requests that fail with a 429.
+        retry_after: The Retry-After header sent with throttled responses.
+        seed: Seeds the random number generator so runs can be repeated.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    seed: int | None = None
+
+
+def load_responses() -> dict[str, list[dict[str, Any]]]:
+    """Returns the saved responses of every endpoint, including their metadata."""
+    # Imported here because rainbow_roll imports the endpoints, which would be
+    # circular if this module is imported from them.
+    from rainbow_roll import response_models  # noqa: PLC0415
+
+    responses: dict[str, list[dict[str, Any]]] = {}
+    for endpoint in response_models():
+        name = re.sub(r"(?<!^)(?=[A-Z])", "_", type(endpoint).__name__).lower()
+        responses[name] = [
+            json.loads(json_file.read_text())
+            for json_file in sorted(endpoint.json_files_folder.glob("*.json"))
+        ]
+    return responses
+
+
+class MockAPI:
+    """Routes requests to saved responses, independent of any HTTP server.
+
+    Responses are found by the path they were originally requested from. Requests
+    for IDs that were never saved are answered with the saved responses of the same
+    endpoint in rotation, so any ID can be used for load testing. Browse pages are
+    built from every saved browse entry, newest first, so ``start`` and ``n`` page
+    through them like the real API.
+    """
+
+    def __init__(
+        self,
+        responses: dict[str, list[dict[str, Any]]] | None = None,
+        faults: FaultConfig | None = None,
+    ) -> None:
+        """Initialize the API.
+
+        Args:
+            responses: The saved responses for each endpoint, defaults to the ones in
+                the ``_files`` folders.
+            faults: The latency and failures to inject.
+        """
+        responses = load_responses() if responses is None else responses
+        self.faults = faults or FaultConfig()
+        # S311 - The faults only need to be repeatable, not secure.
+        self._random = random.Random(self.faults.seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._tokens = itertools.count()
+        self._by_path: dict[str, bytes] = {}
+        self._rotations: dict[str, Iterator[bytes]] = {}
+
+        for name, saved in responses.items():
+            bodies: list[bytes] = []
+            for response in saved:
+                body = dict(response)
+                metadata = body.pop("rainbow_roll", None) or {}
+                encoded = json.dumps(body).encode()
+                bodies.append(encoded)
+                if url := metadata.get("url"):
+                    self._by_path[urlsplit(url).path] = encoded
+            if bodies:
+                self._rotations[name] = itertools.cycle(bodies)
+
+        browse = responses.get("browse_series", [])
+        entries = {
+            entry["id"]: entry for response in browse for entry in response["data"]
+        }
+        self._browse_entries = sorted(
+            entries.values(),
+            key=lambda entry: entry["last_public"],
+            reverse=True,
+        )
+        self._browse_meta = browse[0].get("meta", {}) if browse else {}
+
+    def _fault(self) -> Response | None:
+        """Returns a failure response if one should be injected."""
+        with self._lock:
+            roll = self._random.random()
+            delay = self.faults.latency + self._random.uniform(0, self.faults.jitter)
+
+        if delay:
+            time.sleep(delay)
+
+        if roll < self.faults.throttle_rate:
+            headers = {"Retry-After": str(self.faults.retry_after)}
+            return HTTPStatus.TOO_MANY_REQUESTS, headers, b""
+
+        if roll < self.faults.throttle_rate + self.faults.error_rate:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {}, b""
+
+        return None
+
+    def _token(self) -> bytes:
+        with self._lock:
+            token = f"mock-access-token-{next(self._tokens)}"
+        return json.dumps(
+            {
+                "access_token": token,
+                "refresh_token": "mock-refresh-token",
+                "expires_in": TOKEN_LIFETIME,
+                "token_type": "Bearer",
+            },
+        ).encode()
+
+    def _browse(self, query: dict[str, list[str]]) -> bytes:
+        start = int(query.get("start", ["0"])[0])
+        n = int(query.get("n", ["36"])[0])
+        return json.dumps(
+            {
+                "total": len(self._browse_entries),
+                "data": self._browse_entries[start : start + n],
+                "meta": self._browse_meta,
+            },
+        ).encode()
+
+    def _saved(self, path: str) -> bytes | None:
+        if body := self._by_path.get(path):
+            return body
+
+        if (name := route(path.removeprefix("/"))) in self._rotations:
+            with self._lock:
+                return next(self._rotations[name])
+
+        return None
+
+    def handle(self, method: str, url: str) -> Response:
+        """Returns the status, headers, and body of the response to a request."""
+        parts = urlsplit(url)
+
+        if parts.path.endswith("/bundle.js"):
+            return (
+                HTTPStatus.OK,
+                {"Content-Type": "text/javascript"},
+                BUNDLE_JS.encode(),
+            )
+
+        if fault := self._fault():
+            return fault
+
+        json_headers = {"Content-Type": "application/json"}
+        if method == "POST" and parts.path == "/auth/v1/token":
+            return HTTPStatus.OK, json_headers, self._token()
+
+        if method == "GET" and route(parts.path.removeprefix("/")) == "browse_series":
+            return HTTPStatus.OK, json_headers, self._browse(parse_qs(parts.query))
+
+        if method == "GET" and (body := self._saved(parts.path)) is not None:
+            return HTTPStatus.OK, json_headers, body
+
+        return HTTPStatus.NOT_FOUND, {}, b""
+
+
+class MockAdapter(HTTPAdapter):
+    """Answers the requests of a session from a ``MockAPI`` without a server.
+
+    Requests never leave the process, which makes it cheaper than ``MockServer``
+    when only the client is being measured::
+
+        client = RainbowRoll(adapter=MockAdapter(MockAPI()))
+    """
+
+    def __init__(self, api: MockAPI | None = None) -> None:
+        """Initialize the adapter.
+
+        Args:
+            api: The API to answer requests from, defaults to one with the saved
+                responses and no faults.
+        """
+        super().__init__()
+        self.api = api or MockAPI()
+
+    @override
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        status, headers, body = self.api.handle(
+            request.method or "GET",
+            request.url or "",
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        # SLF001 - Setting the content directly is how requests builds responses.
+        response._content = body  # noqa: SLF001
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self) -> None:
+        # The body of a token request has to be read so the connection can be reused.
+        if length := int(self.headers.get("Content-Length", 0)):
+            self.rfile.read(length)
+
+        status, headers, body = self.server.api.handle(self.command, self.path)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # N815 - The names are required by BaseHTTPRequestHandler.
+    do_GET = _respond  # noqa: N815
+    do_POST = _respond  # noqa: N815
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    api: MockAPI
+
+
+class MockServer:
+    """Serves a ``MockAPI`` over HTTP on a background thread."""
+
+    def __init__(
+        self,
+        api: MockAPI | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            api: The API to serve, defaults to one with the saved responses and no
+                faults.
+            host: The host to listen on.
+            port: The port to listen on, or 0 to pick a free port.
+        """
+        self.api = api or MockAPI()
+        self._server = _Server((host, port), _Handler)
+        self._server.api = self.api
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> str:
+        """The host and port the server is listening on."""
+        host, port = self._server.server_address[:2]
+        return f"{host!s}:{port}"
+
+    def configure(self, client: RainbowRoll | AsyncRainbowRoll) -> None:
+        """Points a client at the server instead of Crunchyroll."""
+        client.scheme = "http"
+        client.domain = self.address
+        client.bundle_js_url = f"http://{self.address}/bundle.js"
+
+    def serve_forever(self) -> None:
+        """Serve requests on the current thread until the server is stopped."""
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Start serving requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+
+def main() -> None:
+    """Runs the server until it is interrupted."""
+    parser = argparse.ArgumentParser(prog="python -m rainbow_roll.mock_server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = MockServer(MockAPI(faults=faults), host=args.host, port=args.port)
+    # T201 - The address is printed so it can be passed to the client.
+    print(f"Serving the mock Crunchyroll API on http://{server.address}")  # noqa: T201
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
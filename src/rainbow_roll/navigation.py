@@ -0,0 +1,180 @@
+"""Navigation between the episodes of a series in watch order."""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING
+
+from rainbow_roll.seasons import models as seasons_models
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rainbow_roll.episodes import models as episodes_models
+
+type _EpisodeKey = tuple[float, str]
+type _SeasonKey = tuple[int, str]
+
+
+class EpisodeGraph:
+    """Indexes episodes by season and series so they can be navigated in order.
+
+    Episodes are ordered by ``sequence_number`` within their season, and seasons by
+    ``season_sequence_number`` within their series, so dubbed seasons come after
+    the seasons they dub like they do on Crunchyroll. Both orders are kept sorted as
+    responses are added, so the graph can be built incrementally as seasons are
+    fetched. Looking up the next or previous episode takes O(log n) time, and
+    looking up an episode by ID or by its number in a season takes O(1) time.
+
+    Seasons responses are optional, since episodes include the order of their
+    season, but they let seasons be ordered before their episodes are added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._episodes: dict[str, episodes_models.Datum] = {}
+        self._by_number: dict[tuple[str, int], str] = {}
+        self._season_episodes: dict[str, list[_EpisodeKey]] = {}
+        self._seasons: dict[str, tuple[str, int]] = {}
+        self._series_seasons: dict[str, list[_SeasonKey]] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of episodes."""
+        return len(self._episodes)
+
+    def __contains__(self, episode_id: object) -> bool:
+        """Returns True if the graph has an episode with the ID."""
+        return episode_id in self._episodes
+
+    def add(self, response: seasons_models.Seasons | episodes_models.Episodes) -> None:
+        """Adds the entries of a Seasons or Episodes response."""
+        if isinstance(response, seasons_models.Seasons):
+            self.add_seasons(response.data)
+        else:
+            self.add_episodes(response.data)
+
+    def _add_season(self, season_id: str, series_id: str, sequence: int) -> None:
+        """Adds a season to its series, moving it if its position changed."""
+        if (current := self._seasons.get(season_id)) == (series_id, sequence):
+            return
+
+        if current is not None:
+            current_series_id, current_sequence = current
+            self._series_seasons[current_series_id].remove(
+                (current_sequence, season_id),
+            )
+
+        self._seasons[season_id] = (series_id, sequence)
+        bisect.insort(
+            self._series_seasons.setdefault(series_id, []),
+            (sequence, season_id),
+        )
+
+    def add_seasons(self, seasons: Iterable[seasons_models.Datum]) -> None:
+        """Adds seasons, which orders them before their episodes are added."""
+        for season in seasons:
+            self._add_season(season.id, season.series_id, season.season_sequence_number)
+
+    def add_episodes(self, episodes: Iterable[episodes_models.Datum]) -> None:
+        """Adds episodes, replacing any that were added before."""
+        for episode in episodes:
+            if (current := self._episodes.get(episode.id)) is not None:
+                self._season_episodes[current.season_id].remove(
+                    (current.sequence_number, current.id),
+                )
+                if current.episode_number is not None:
+                    self._by_number.pop((current.season_id, current.episode_number))
+
+            self._add_season(
+                episode.season_id,
+                episode.series_id,
+                episode.season_sequence_number,
+            )
+            self._episodes[episode.id] = episode
+            bisect.insort(
+                self._season_episodes.setdefault(episode.season_id, []),
+                (episode.sequence_number, episode.id),
+            )
+            if episode.episode_number is not None:
+                self._by_number[(episode.season_id, episode.episode_number)] = (
+                    episode.id
+                )
+
+    def episode(self, episode_id: str) -> episodes_models.Datum | None:
+        """Returns the episode with the ID, if it has been added."""
+        return self._episodes.get(episode_id)
+
+    def find_episode(
+        self,
+        season_id: str,
+        episode_number: int,
+    ) -> episodes_models.Datum | None:
+        """Returns the episode with the given number in a season, if it was added."""
+        episode_id = self._by_number.get((season_id, episode_number))
+        return None if episode_id is None else self._episodes[episode_id]
+
+    def seasons_of(self, series_id: str) -> list[str]:
+        """Returns the IDs of the seasons of a series in order."""
+        return [season_id for _, season_id in self._series_seasons.get(series_id, [])]
+
+    def episodes_of(self, season_id: str) -> list[episodes_models.Datum]:
+        """Returns the episodes of a season in order."""
+        return [
+            self._episodes[episode_id]
+            for _, episode_id in self._season_episodes.get(season_id, [])
+        ]
+
+    def _adjacent_season(self, season_id: str, step: int) -> list[_EpisodeKey]:
+        """Returns the episodes of the nearest season in a direction that has any."""
+        series_id, sequence = self._seasons[season_id]
+        seasons = self._series_seasons[series_id]
+        index = bisect.bisect_left(seasons, (sequence, season_id)) + step
+        while 0 <= index < len(seasons):
+            if episodes := self._season_episodes.get(seasons[index][1]):
+                return episodes
+            index += step
+        return []
+
+    def next(self, episode_id: str) -> episodes_models.Datum | None:
+        """Returns the episode after an episode in watch order.
+
+        After the last episode of a season comes the first episode of the next season
+        of the series that has episodes.
+        """
+        if (episode := self._episodes.get(episode_id)) is None:
+            return None
+
+        episodes = self._season_episodes[episode.season_id]
+        index = bisect.bisect_right(episodes, (episode.sequence_number, episode.id))
+        if index < len(episodes):
+            return self._episodes[episodes[index][1]]
+
+        if next_season := self._adjacent_season(episode.season_id, 1):
+            return self._episodes[next_season[0][1]]
+        return None
+
+    def previous(self, episode_id: str) -> episodes_models.Datum | None:
+        """Returns the episode before an episode in watch order.
+
+        Before the first episode of a season comes the last episode of the previous
+        season of the series that has episodes.
+        """
+        if (episode := self._episodes.get(episode_id)) is None:
+            return None
+
+        episodes = self._season_episodes[episode.season_id]
+        index = bisect.bisect_left(episodes, (episode.sequence_number, episode.id))
+        if index > 0:
+            return self._episodes[episodes[index - 1][1]]
+
+        if previous_season := self._adjacent_season(episode.season_id, -1):
+            return self._episodes[previous_season[-1][1]]
+        return None
+
+    def watch_order(self, series_id: str) -> list[episodes_models.Datum]:
+        """Returns every episode of a series that has been added, in watch order."""
+        return [
+            episode
+            for season_id in self.seasons_of(series_id)
+            for episode in self.episodes_of(season_id)
+        ]
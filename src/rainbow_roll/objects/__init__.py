@@ -0,0 +1,204 @@
+"""Objects API endpoint for looking up many series, seasons, or episodes at once."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, override
+
+from rainbow_roll.base_api_endpoint import AsyncBaseEndpoint, BaseEndpoint, Request
+from rainbow_roll.objects import models
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# The IDs are part of the URL, so this keeps the URL comfortably short.
+MAX_BATCH_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+
+
+def _request(object_ids: Sequence[str], locale: str) -> Request:
+    if len(object_ids) > MAX_BATCH_SIZE:
+        msg = f"Cannot request more than {MAX_BATCH_SIZE} objects at once"
+        raise ValueError(msg)
+
+    headers = {"referer": "https://www.crunchyroll.com/"}
+    endpoint = "content/v2/cms/objects/" + ",".join(object_ids)
+    params = {"locale": locale, "ratings": "true"}
+    return Request(endpoint, params, headers)
+
+
+def _batches(object_ids: Iterable[str], batch_size: int) -> list[list[str]]:
+    """Splits the unique IDs into batches of at most batch_size IDs."""
+    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    unique_ids = list(dict.fromkeys(object_ids))
+    return [
+        unique_ids[start : start + batch_size]
+        for start in range(0, len(unique_ids), batch_size)
+    ]
+
+
+class Objects(BaseEndpoint[models.Objects]):
+    """Provides methods to download, parse, and retrieve objects by ID in batches."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.Objects]:
+        return models.Objects
+
+    def download(
+        self,
+        object_ids: Sequence[str],
+        *,
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads the objects with the given IDs in a single request.
+
+        Args:
+            object_ids: The IDs of the objects, at most ``MAX_BATCH_SIZE`` of them.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        return self._client.download(*_request(object_ids, locale))
+
+    def get(
+        self,
+        object_ids: Sequence[str],
+        *,
+        locale: str = "en-US",
+    ) -> models.Objects:
+        """Downloads and parses the objects with the given IDs in a single request.
+
+        Convenience method that downloads the response and parses it with
+        ``parse_raw()``.
+
+        Args:
+            object_ids: The IDs of the objects, at most ``MAX_BATCH_SIZE`` of them.
+            locale: The locale for the request.
+
+        Returns:
+            An Objects model containing the parsed data.
+        """
+        return self.parse_raw(self._client.download_raw(*_request(object_ids, locale)))
+
+    def get_many(
+        self,
+        object_ids: Iterable[str],
+        *,
+        locale: str = "en-US",
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[models.Objects]:
+        """Gets any number of objects by splitting the IDs into concurrent batches.
+
+        Duplicate IDs are only requested once.
+
+        Args:
+            object_ids: The IDs of the objects.
+            locale: The locale for the requests.
+            batch_size: The number of IDs in each request.
+            max_workers: The number of requests to make at the same time.
+
+        Returns:
+            One Objects model for each batch, in the same order as the IDs.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda batch: self.get(batch, locale=locale),
+                    _batches(object_ids, batch_size),
+                ),
+            )
+
+    def entries(
+        self,
+        input_data: models.Objects | list[models.Objects] | dict[str, Any],
+    ) -> list[models.Datum]:
+        """Returns all of the objects from one or more Objects responses."""
+        if isinstance(input_data, list):
+            result: list[models.Datum] = []
+            for response in input_data:
+                result.extend(self.entries(response))
+            return result
+
+        # Support for when the raw data for an Objects is passed in as the input.
+        if isinstance(input_data, dict):
+            input_data = self.parse(input_data)
+
+        return input_data.data
+
+
+class AsyncObjects(AsyncBaseEndpoint[models.Objects]):
+    """Provides async methods to retrieve objects by ID in batches."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.Objects]:
+        return models.Objects
+
+    async def download(
+        self,
+        object_ids: Sequence[str],
+        *,
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads the objects with the given IDs in a single request.
+
+        Args:
+            object_ids: The IDs of the objects, at most ``MAX_BATCH_SIZE`` of them.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        return await self._client.download(*_request(object_ids, locale))
+
+    async def get(
+        self,
+        object_ids: Sequence[str],
+        *,
+        locale: str = "en-US",
+    ) -> models.Objects:
+        """Downloads and parses the objects with the given IDs in a single request.
+
+        Args:
+            object_ids: The IDs of the objects, at most ``MAX_BATCH_SIZE`` of them.
+            locale: The locale for the request.
+
+        Returns:
+            An Objects model containing the parsed data.
+        """
+        response = await self._client.download_raw(*_request(object_ids, locale))
+        return self.parse_raw(response)
+
+    async def get_many(
+        self,
+        object_ids: Iterable[str],
+        *,
+        locale: str = "en-US",
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> list[models.Objects]:
+        """Gets any number of objects by splitting the IDs into concurrent batches.
+
+        Duplicate IDs are only requested once, and the client's concurrency limit
+        applies to the batches.
+
+        Args:
+            object_ids: The IDs of the objects.
+            locale: The locale for the requests.
+            batch_size: The number of IDs in each request.
+
+        Returns:
+            One Objects model for each batch, in the same order as the IDs.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get(batch, locale=locale)
+                    for batch in _batches(object_ids, batch_size)
+                ),
+            ),
+        )
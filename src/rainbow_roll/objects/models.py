@@ -0,0 +1,52 @@
+# ruff: noqa: D100, D101
+# Placeholder until responses from this endpoint are saved. The endpoint is not in
+# response_models() yet, so it has to be added there before the models can be
+# generated with _tools/rebuild_models.py. Until then changes to the API are not
+# detected. Objects can be series, seasons, episodes, movie listings, or movies, so
+# only the fields they all share are required and every other field is kept as is.
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Datum(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    id: str
+    type: str
+    title: str | None = None
+    slug_title: str | None = None
+    channel_id: str | None = None
+    description: str | None = None
+    images: dict[str, Any] | None = None
+    series_metadata: dict[str, Any] | None = None
+    season_metadata: dict[str, Any] | None = None
+    episode_metadata: dict[str, Any] | None = None
+    movie_listing_metadata: dict[str, Any] | None = None
+    movie_metadata: dict[str, Any] | None = None
+
+
+class Params(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    locale: str
+    ratings: str
+
+
+class Headers(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    referer: str
+
+
+class RainbowRoll(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    params: Params
+    headers: Headers
+    url: str
+
+
+class Objects(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    total: int
+    data: list[Datum]
+    rainbow_roll: RainbowRoll | None = None
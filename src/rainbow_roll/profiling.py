@@ -0,0 +1,252 @@
+"""Profiling of the time and memory spent validating each model and field type."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@dataclass
+class ProfileStats:
+    """The aggregated cost of validating a model or a field type.
+
+    Attributes:
+        calls: The number of values that were validated.
+        total_time: The number of seconds spent validating the values, including any
+            nested models.
+        self_time: The number of seconds spent validating the values, excluding any
+            nested models.
+        memory: The number of bytes allocated by the validated values, excluding any
+            nested models. Only measured when the profiler tracks memory.
+    """
+
+    calls: int = 0
+    total_time: float = 0.0
+    self_time: float = 0.0
+    memory: int = 0
+
+
+def _type_name(annotation: Any) -> str:  # noqa: ANN401
+    """Returns a short name for a type, without module names."""
+    if isinstance(annotation, type) and not get_args(annotation):
+        return annotation.__name__
+    return re.sub(r"\b(?:[\w]+\.)+(\w+)", r"\1", repr(annotation))
+
+
+@cache
+def _adapter(annotation: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+    return TypeAdapter(annotation)
+
+
+def has_model(annotation: Any) -> bool:  # noqa: ANN401
+    """Returns True if a type is or contains a model."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(has_model(arg) for arg in get_args(annotation))
+
+
+class ParseProfiler:
+    """Measures how much of the cost of parsing is spent on each model and field type.
+
+    pydantic validates a whole response in a single call, so the profiler validates
+    every nested model and every field value on its own and attributes the time to
+    the model and field type. Each model's self time is its total time minus the
+    total time of the models nested in it. Validating the parts separately is slower
+    than validating a response at once, so the results are best compared with each
+    other rather than with unprofiled parse times.
+
+    Results are aggregated across calls until ``reset()`` is called.
+    """
+
+    def __init__(self, *, memory: bool = False) -> None:
+        """Initialize the profiler.
+
+        Args:
+            memory: Also measure the memory allocated by each model, which traces
+                every allocation and makes profiling much slower.
+        """
+        self.memory = memory
+        self.models: dict[str, ProfileStats] = {}
+        self.fields: dict[str, ProfileStats] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Discard every result."""
+        with self._lock:
+            self.models.clear()
+            self.fields.clear()
+
+    def _record(
+        self,
+        stats: dict[str, ProfileStats],
+        name: str,
+        total_time: float,
+        self_time: float,
+        memory: int,
+    ) -> None:
+        with self._lock:
+            entry = stats.setdefault(name, ProfileStats())
+            entry.calls += 1
+            entry.total_time += total_time
+            entry.self_time += self_time
+            entry.memory += memory
+
+    def _children(self, annotation: Any, value: Any) -> tuple[float, int]:  # noqa: ANN401
+        """Profiles the models nested in a value, returning their time and memory."""
+        if value is None:
+            return 0.0, 0
+
+        origin = get_origin(annotation)
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        # Unions of several types are skipped because picking the right type would
+        # require validating the value.
+        if origin in {Union, UnionType} and len(args) == 1:
+            return self._children(args[0], value)
+
+        if origin is list and isinstance(value, list):
+            elapsed, memory = 0.0, 0
+            for item in value:
+                item_elapsed, item_memory = self._children(args[0], item)
+                elapsed += item_elapsed
+                memory += item_memory
+            return elapsed, memory
+
+        if (
+            isinstance(annotation, type)
+            and issubclass(annotation, BaseModel)
+            and isinstance(value, dict)
+        ):
+            _, elapsed, memory = self._validate(annotation, value)
+            return elapsed, memory
+
+        return 0.0, 0
+
+    def _measure(self, validate: Any, value: Any) -> tuple[Any, float, int]:  # noqa: ANN401
+        """Returns the result of validate, and the time and memory it took."""
+        before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        started = time.perf_counter()
+        result = validate(value)
+        elapsed = time.perf_counter() - started
+        memory = tracemalloc.get_traced_memory()[0] - before if self.memory else 0
+        return result, elapsed, max(memory, 0)
+
+    def _validate[T: BaseModel](
+        self,
+        model: type[T],
+        data: dict[str, Any],
+    ) -> tuple[T, float, int]:
+        """Validates a model, profiling its nested models and fields."""
+        children_time, children_memory = 0.0, 0
+
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            if key not in data:
+                continue
+
+            value = data[key]
+            if has_model(field.annotation):
+                elapsed, memory = self._children(field.annotation, value)
+                children_time += elapsed
+                children_memory += memory
+                continue
+
+            try:
+                _, elapsed, memory = self._measure(
+                    _adapter(field.annotation).validate_python,
+                    value,
+                )
+            except ValueError:
+                # The error is raised by validating the whole model below.
+                continue
+            self._record(
+                self.fields,
+                _type_name(field.annotation),
+                elapsed,
+                elapsed,
+                memory,
+            )
+
+        result, elapsed, memory = self._measure(model.model_validate, data)
+        self._record(
+            self.models,
+            f"{model.__module__.removeprefix('rainbow_roll.')}.{model.__name__}",
+            elapsed,
+            max(elapsed - children_time, 0),
+            max(memory - children_memory, 0),
+        )
+        return result, elapsed, memory
+
+    def profile[T: BaseModel](self, model: type[T], data: dict[str, Any]) -> T:
+        """Validates data into a model, recording the cost of each part.
+
+        Args:
+            model: The model to validate.
+            data: The raw JSON data for the model.
+
+        Returns:
+            The validated model.
+        """
+        if not self.memory:
+            return self._validate(model, data)[0]
+
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        try:
+            return self._validate(model, data)[0]
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Returns every result as JSON compatible data."""
+        with self._lock:
+            return {
+                kind: {
+                    name: {
+                        "calls": stats.calls,
+                        "total_time": stats.total_time,
+                        "self_time": stats.self_time,
+                        "memory": stats.memory,
+                    }
+                    for name, stats in results.items()
+                }
+                for kind, results in (("models", self.models), ("fields", self.fields))
+            }
+
+    def report(self, limit: int | None = None) -> str:
+        """Returns a table of the models and field types, most expensive first.
+
+        Args:
+            limit: The maximum number of models and of field types to include.
+        """
+        lines: list[str] = []
+        with self._lock:
+            sections = (("Model", self.models), ("Field type", self.fields))
+            for title, results in sections:
+                ranked = sorted(
+                    results.items(),
+                    key=lambda item: item[1].self_time,
+                    reverse=True,
+                )[:limit]
+                lines.append(
+                    f"{title:<50} {'calls':>9} {'self ms':>10} "
+                    f"{'total ms':>10} {'KiB':>10}",
+                )
+                lines.extend(
+                    f"{name[:50]:<50} {stats.calls:>9} "
+                    f"{stats.self_time * 1000:>10.2f} "
+                    f"{stats.total_time * 1000:>10.2f} "
+                    f"{stats.memory / 1024:>10.1f}"
+                    for name, stats in ranked
+                )
+                lines.append("")
+        return "\n".join(lines)
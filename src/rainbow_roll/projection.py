@@ -0,0 +1,108 @@
+"""Projections that parse only selected fields of each entry into compact records."""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from rainbow_roll.base_api_endpoint import RawResponse
+
+
+class Projection[R: tuple[Any, ...]]:
+    """A subset of the fields of an entry model, parsed into tuple-backed records.
+
+    Only the selected fields are validated and kept, so the nested models, lists, and
+    datetimes of every other field are never built. Records are named tuples, which
+    have no per-instance ``__dict__``, so a list of them uses a fraction of the
+    memory of the full models.
+
+    Fields are selected with a ``NamedTuple`` whose field names match the model's,
+    which keeps the records typed::
+
+        class EpisodeSummary(NamedTuple):
+            id: str
+            title: str
+            episode_air_date: datetime
+
+        projection = Projection(episodes.models.Datum, EpisodeSummary)
+
+    or by name with ``Projection.of()``. Each field is validated with the type it
+    has in the model, whatever its type in the record.
+    """
+
+    def __init__(self, model: type[BaseModel], record: type[R]) -> None:
+        """Initialize the projection.
+
+        Args:
+            model: The model of the entries in the ``data`` list of a response.
+            record: The named tuple to build, its fields are the selected fields.
+
+        Raises:
+            ValueError: If a field of the record is not a field of the model.
+        """
+        fields: tuple[str, ...] = record._fields  # type: ignore[attr-defined]
+        if unknown := [name for name in fields if name not in model.model_fields]:
+            msg = f"{model.__name__} does not have the fields: {', '.join(unknown)}"
+            raise ValueError(msg)
+
+        self.model = model
+        self.record = record
+
+        entry_fields: dict[str, Any] = {}
+        self._keys: list[tuple[str, Any]] = []
+        for name in fields:
+            field = model.model_fields[name]
+            key = field.alias or name
+            if field.is_required():
+                entry_fields[key] = field.annotation
+            else:
+                entry_fields[key] = NotRequired[field.annotation]  # type: ignore[valid-type]
+            self._keys.append((key, field.get_default(call_default_factory=True)))
+
+        # TypedDicts ignore the keys of fields that were not selected, so pydantic
+        # never builds them.
+        entry = TypedDict(f"{record.__name__}Entry", entry_fields)  # type: ignore[misc]
+        # UP013 - The class syntax can't refer to the entry type created above.
+        response = TypedDict(  # type: ignore[misc]  # noqa: UP013
+            f"{record.__name__}Response",
+            {"data": list[entry]},  # type: ignore[valid-type]
+        )
+        self._adapter = TypeAdapter(response)
+
+    @classmethod
+    def of(
+        cls,
+        model: type[BaseModel],
+        *fields: str,
+        name: str | None = None,
+    ) -> Projection[Any]:
+        """Returns a projection of the named fields of a model.
+
+        Args:
+            model: The model of the entries in the ``data`` list of a response.
+            fields: The names of the fields to keep.
+            name: The name of the record type, defaults to the model's name followed
+                by ``Record``.
+        """
+        record = namedtuple(name or f"{model.__name__}Record", fields)  # noqa: PYI024
+        return cls(model, record)
+
+    def _records(self, entries: list[dict[str, Any]]) -> list[R]:
+        record = self.record
+        keys = self._keys
+        return [
+            record(*[entry.get(key, default) for key, default in keys])
+            for entry in entries
+        ]
+
+    def parse(self, data: dict[str, Any]) -> list[R]:
+        """Returns a record for every entry in the ``data`` of a decoded response."""
+        return self._records(self._adapter.validate_python(data)["data"])
+
+    def parse_raw(self, response: RawResponse | bytes) -> list[R]:
+        """Returns a record for every entry in the ``data`` of an undecoded response."""
+        body = response if isinstance(response, bytes) else response.body
+        return self._records(self._adapter.validate_json(body)["data"])
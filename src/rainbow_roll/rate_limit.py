@@ -0,0 +1,136 @@
+"""Rate limiting and retry helpers for requests to the Crunchyroll API."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+DEFAULT_RATE = 10.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """A thread-safe token bucket that adapts its rate to the server.
+
+    The rate is cut whenever the server throttles a request and slowly raised again
+    after every successful request, so it stays close to the highest rate the server
+    allows. A single limiter can be shared by several clients.
+    """
+
+    # PLR0913 - Each part of the adaptive behavior needs to be configurable.
+    def __init__(  # noqa: PLR0913
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int | None = None,
+        *,
+        min_rate: float = 0.5,
+        max_rate: float | None = None,
+        decrease_factor: float = 0.5,
+        increase: float = 0.1,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: The starting number of requests per second.
+            burst: The number of requests that can be made at once, defaults to the
+                rate rounded up.
+            min_rate: The lowest rate that throttling can reduce the rate to.
+            max_rate: The highest rate that successful requests can raise the rate to,
+                defaults to the starting rate.
+            decrease_factor: The rate is multiplied by this when throttled.
+            increase: The rate is increased by this after a successful request.
+        """
+        self.rate = rate
+        self.burst = burst or max(1, int(rate + 0.999))
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before it can be used."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Blocks until a request can be made."""
+        if delay := self.reserve():
+            time.sleep(delay)
+
+    def throttled(self) -> None:
+        """Reduces the rate after the server throttled a request."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+    def succeeded(self) -> None:
+        """Raises the rate after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def observe(self, status_code: int) -> None:
+        """Adjusts the rate for the status code of a response.
+
+        The rate is only raised for 2xx and 304 responses, so server errors and other
+        failures never make the limiter more aggressive.
+        """
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            self.throttled()
+        elif (
+            HTTPStatus.OK <= status_code < HTTPStatus.MULTIPLE_CHOICES
+            or status_code == HTTPStatus.NOT_MODIFIED
+        ):
+            self.succeeded()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Controls how failed requests are retried."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """Returns how long to wait before retrying.
+
+        The server's Retry-After header is used when there is one, otherwise the delay
+        is an exponential backoff with full jitter.
+
+        Args:
+            attempt: The number of the attempt that failed, starting from zero.
+            retry_after: The value of the Retry-After header, if any.
+        """
+        if retry_after:
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=UTC)
+                seconds = (retry_at - datetime.now(tz=UTC)).total_seconds()
+                return min(max(seconds, 0.0), self.backoff_max)
+
+        # Jitter is used to spread out retries, it does not need to be secure.
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,23 @@
+"""The paths of the Crunchyroll API endpoints, shared by everything that routes them."""
+
+from __future__ import annotations
+
+import re
+
+# Keyed by the name of the client attribute for each endpoint. Paths are relative to
+# the API domain, without a leading slash.
+ROUTES = {
+    "browse_series": re.compile(r"content/v2/discover/browse"),
+    "series": re.compile(r"content/v2/cms/series/[^/]+"),
+    "seasons": re.compile(r"content/v2/cms/series/[^/]+/seasons"),
+    "episodes": re.compile(r"content/v2/cms/seasons/[^/]+/episodes"),
+    "objects": re.compile(r"content/v2/cms/objects/[^/]+"),
+}
+
+
+def route(endpoint: str) -> str | None:
+    """Returns the name of the route an endpoint path belongs to, if any."""
+    for name, pattern in ROUTES.items():
+        if pattern.fullmatch(endpoint):
+            return name
+    return None
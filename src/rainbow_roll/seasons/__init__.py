@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 
-from rainbow_roll.base_api_endpoint import BaseEndpoint
+from rainbow_roll.base_api_endpoint import AsyncBaseEndpoint, BaseEndpoint, Request
 from rainbow_roll.seasons import models
 
+if TYPE_CHECKING:
+    from rainbow_roll.projection import Projection
+
+
+def _request(series_id: str, locale: str) -> Request:
+    # This referer is valid, but it's not the ideal one because the real one would
+    # include the series slug at the end as well.
+    headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
+    endpoint = f"content/v2/cms/series/{series_id}/seasons"
+    params: dict[str, str | None] = {"locale": locale, "force_locale": None}
+    return Request(endpoint, params, headers)
+
 
 class Seasons(BaseEndpoint[models.Seasons]):
     """Provides methods to download, parse, and retrieve seasons data."""
@@ -32,21 +44,78 @@ class Seasons(BaseEndpoint[models.Seasons]):
         Returns:
             The raw JSON response as a dict, suitable for passing to ``parse()``.
         """
-        # This referer is valid, but it's not the ideal one because the real one would
-        # include the series slug at the end as well.
-        headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
-        endpoint = f"content/v2/cms/series/{series_id}/seasons"
-        params: dict[str, str | None] = {"locale": locale, "force_locale": None}
-        return self._client.download(
-            endpoint=endpoint,
-            params=params,
-            headers=headers,
-        )
+        return self._client.download(*_request(series_id, locale))
 
     def get(self, series_id: str, *, locale: str = "en-US") -> models.Seasons:
         """Downloads and parses seasons data for a given series ID.
 
-        Convenience method that calls ``download()`` then ``parse()``.
+        Convenience method that downloads the response and parses it with
+        ``parse_raw()``. The result is served from the endpoint's model cache when it
+        is enabled.
+
+        Args:
+            series_id: The ID of the series to get seasons for.
+            locale: The locale for the request.
+
+        Returns:
+            A Seasons model containing the parsed data.
+        """
+        return self._cached_get(
+            (series_id, locale),
+            lambda: self.parse_raw(
+                self._client.download_raw(*_request(series_id, locale)),
+            ),
+        )
+
+    def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads seasons data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The ID of the series to get seasons for.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        return projection.parse_raw(
+            self._client.download_raw(*_request(series_id, locale)),
+        )
+
+
+class AsyncSeasons(AsyncBaseEndpoint[models.Seasons]):
+    """Provides async methods to download, parse, and retrieve seasons data."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.Seasons]:
+        return models.Seasons
+
+    async def download(
+        self,
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads seasons data for a given series ID.
+
+        Args:
+            series_id: The ID of the series to get seasons for.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        return await self._client.download(*_request(series_id, locale))
+
+    async def get(self, series_id: str, *, locale: str = "en-US") -> models.Seasons:
+        """Downloads and parses seasons data for a given series ID.
 
         Args:
             series_id: The ID of the series to get seasons for.
@@ -55,5 +124,25 @@ class Seasons(BaseEndpoint[models.Seasons]):
         Returns:
             A Seasons model containing the parsed data.
         """
-        data = self.download(series_id, locale=locale)
-        return self.parse(data)
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return self.parse_raw(response)
+
+    async def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads seasons data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The ID of the series to get seasons for.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return projection.parse_raw(response)
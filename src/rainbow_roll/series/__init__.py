@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, override
 
-from rainbow_roll.base_api_endpoint import BaseEndpoint
+from rainbow_roll.base_api_endpoint import AsyncBaseEndpoint, BaseEndpoint, Request
 from rainbow_roll.series import models
 
+if TYPE_CHECKING:
+    from rainbow_roll.projection import Projection
+
+
+def _request(series_id: str, locale: str) -> Request:
+    params = {"locale": locale}
+
+    # This referer is valid, but it's not the ideal one because the real one would
+    # include the series slug at the end as well.
+    headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
+
+    return Request("content/v2/cms/series/" + series_id, params, headers)
+
 
 class Series(BaseEndpoint[models.Series]):
     """Provides methods to download, parse, and retrieve series data."""
@@ -32,22 +45,78 @@ class Series(BaseEndpoint[models.Series]):
         Returns:
             The raw JSON response as a dict, suitable for passing to ``parse()``.
         """
-        params = {"locale": locale}
+        return self._client.download(*_request(series_id, locale))
+
+    def get(self, series_id: str, *, locale: str = "en-US") -> models.Series:
+        """Downloads and parses series data for a given series ID.
 
-        # This referer is valid, but it's not the ideal one because the real one would
-        # include the series slug at the end as well.
-        headers = {"referer": f"https://www.crunchyroll.com/series/{series_id}"}
+        Convenience method that downloads the response and parses it with
+        ``parse_raw()``. The result is served from the endpoint's model cache when it
+        is enabled.
 
-        return self._client.download(
-            endpoint="content/v2/cms/series/" + series_id,
-            params=params,
-            headers=headers,
+        Args:
+            series_id: The ID of the series to get.
+            locale: The locale for the request.
+
+        Returns:
+            A Series model containing the parsed data.
+        """
+        return self._cached_get(
+            (series_id, locale),
+            lambda: self.parse_raw(
+                self._client.download_raw(*_request(series_id, locale)),
+            ),
         )
 
-    def get(self, series_id: str, *, locale: str = "en-US") -> models.Series:
-        """Downloads and parses series data for a given series ID.
+    def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads series data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The ID of the series to get.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        return projection.parse_raw(
+            self._client.download_raw(*_request(series_id, locale)),
+        )
+
+
+class AsyncSeries(AsyncBaseEndpoint[models.Series]):
+    """Provides async methods to download, parse, and retrieve series data."""
+
+    @cached_property
+    @override
+    def _response_model(self) -> type[models.Series]:
+        return models.Series
+
+    async def download(
+        self,
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> dict[str, Any]:
+        """Downloads series data for a given series ID.
+
+        Args:
+            series_id: The ID of the series to download.
+            locale: The locale for the request.
+
+        Returns:
+            The raw JSON response as a dict, suitable for passing to ``parse()``.
+        """
+        return await self._client.download(*_request(series_id, locale))
 
-        Convenience method that calls ``download()`` then ``parse()``.
+    async def get(self, series_id: str, *, locale: str = "en-US") -> models.Series:
+        """Downloads and parses series data for a given series ID.
 
         Args:
             series_id: The ID of the series to get.
@@ -56,5 +125,25 @@ class Series(BaseEndpoint[models.Series]):
         Returns:
             A Series model containing the parsed data.
         """
-        data = self.download(series_id, locale=locale)
-        return self.parse(data)
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return self.parse_raw(response)
+
+    async def get_projected[R: tuple[Any, ...]](
+        self,
+        projection: Projection[R],
+        series_id: str,
+        *,
+        locale: str = "en-US",
+    ) -> list[R]:
+        """Downloads series data and parses only the fields selected by a projection.
+
+        Args:
+            projection: A projection of ``models.Datum``.
+            series_id: The ID of the series to get.
+            locale: The locale for the request.
+
+        Returns:
+            A record for every entry in the response.
+        """
+        response = await self._client.download_raw(*_request(series_id, locale))
+        return projection.parse_raw(response)
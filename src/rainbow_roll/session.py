@@ -0,0 +1,140 @@
+"""HTTP session helpers for rainbow_roll."""
+
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import select_proxy
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Connections are opened on the thread that sends the request, so the time they took
+# is passed from the connection back to the adapter through a thread local.
+_timing = threading.local()
+
+
+def _record_connect(started: float) -> None:
+    if getattr(_timing, "connect_time", None) is not None:
+        _timing.connect_time += time.perf_counter() - started
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _record_connect(started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _record_connect(started)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """A transport adapter that times how long opening each connection takes.
+
+    The time is read with ``connect_time()``. Requests sent through a proxy are not
+    timed.
+    """
+
+    def init_poolmanager(
+        self,
+        # ANN401 - The arguments are passed through to urllib3.
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Create a pool manager whose connections are timed."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    # PLR0913, FBT001, FBT002 - The signature has to match HTTPAdapter.send().
+    def send(  # noqa: PLR0913
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,  # noqa: FBT001, FBT002
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        """Send a request and record how long opening its connection took."""
+        url = request.url or ""
+        _timing.connect_time = None if select_proxy(url, proxies) else 0.0
+        try:
+            response = super().send(request, stream, timeout, verify, cert, proxies)
+        finally:
+            connect_time, _timing.connect_time = _timing.connect_time, None
+        response.connect_time = connect_time  # type: ignore[attr-defined]
+        return response
+
+
+def connect_time(response: requests.Response) -> float | None:
+    """Returns how long opening a connection for a response took.
+
+    Args:
+        response: A response that was sent through a ``TimingHTTPAdapter``.
+
+    Returns:
+        The number of seconds, 0 if a pooled connection was reused, or None if the
+        response was not timed.
+    """
+    return getattr(response, "connect_time", None)
+
+
+def create_session(
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int | Retry = 0,
+    keep_alive: bool = True,
+    adapter: HTTPAdapter | None = None,
+) -> requests.Session:
+    """Creates a session that reuses connections between requests.
+
+    Args:
+        pool_connections: The number of hosts to keep connection pools for.
+        pool_maxsize: The maximum number of connections kept open per host.
+        max_retries: Connection level retries, either a count or a urllib3 ``Retry``.
+        keep_alive: Whether connections should be kept open between requests.
+        adapter: A custom transport adapter, used instead of building one from the
+            pool arguments. Connections are only timed by a ``TimingHTTPAdapter``.
+
+    Returns:
+        A session with the adapter mounted for both http and https.
+    """
+    session = requests.Session()
+
+    if adapter is None:
+        adapter = TimingHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
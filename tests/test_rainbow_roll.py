@@ -1,13 +1,273 @@
 """Tests for the rainbow_roll library."""
 
+import asyncio
 import json
-from datetime import timedelta
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+from gapi import GAPIClient
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, ValidationError
 
 from rainbow_roll import RainbowRoll
+from rainbow_roll.auth import FileTokenStore, Tokens, token_expiry
+from rainbow_roll.base_api_endpoint import BaseExtractor, RawResponse
+from rainbow_roll.cache import ModelCache, ResponseCache
+from rainbow_roll.cassette import Cassette
+from rainbow_roll.catalog import Catalog
+from rainbow_roll.collection import IndexedEntries
+from rainbow_roll.crawler import Crawler, CrawlProgress, SeriesNode
+from rainbow_roll.episodes.models import Datum
+from rainbow_roll.exceptions import CassetteMissError, HTTPError
+from rainbow_roll.instrumentation import (
+    Event,
+    Instrumentation,
+    RequestFinished,
+    RequestStarted,
+    TokenRefreshed,
+)
+from rainbow_roll.interning import Interner
+from rainbow_roll.lazy import LazyEntries
+from rainbow_roll.mock_server import FaultConfig, MockAdapter, MockAPI, MockServer
+from rainbow_roll.navigation import EpisodeGraph
+from rainbow_roll.objects import MAX_BATCH_SIZE, _batches
+from rainbow_roll.profiling import ParseProfiler
+from rainbow_roll.projection import Projection
+from rainbow_roll.rate_limit import RateLimiter, RetryPolicy
+from rainbow_roll.sync import BrowseSync, FileSyncStore, SyncState, Watermark
 
 client = RainbowRoll()
 
 
+def episodes_data(
+    season_id: str,
+    *episodes: tuple[str, int, str],
+    locale: str = "en-US",
+) -> dict[str, Any]:
+    """Returns a minimal Episodes response for (ID, number, air date) tuples."""
+    return {
+        "total": len(episodes),
+        "data": [
+            {
+                "id": episode_id,
+                "title": f"Episode {number}",
+                "series_id": "series",
+                "series_title": "Series",
+                "series_slug_title": "series",
+                "season_id": season_id,
+                "season_title": "Season",
+                "season_slug_title": "season",
+                "season_number": 1,
+                "season_sequence_number": 1,
+                "season_display_number": "",
+                "season_tags": [],
+                "sequence_number": number,
+                "episode_number": number,
+                "episode": str(number),
+                "episode_air_date": air_date,
+                "upload_date": air_date,
+                "availability_starts": air_date,
+                "availability_ends": "2099-01-01T00:00:00Z",
+                "free_available_date": air_date,
+                "premium_available_date": air_date,
+                "available_date": None,
+                "premium_date": None,
+                "availability_status": "available",
+                "availability_notes": "",
+                "audio_locale": "ja-JP",
+                "recent_audio_locale": "ja-JP",
+                "subtitle_locales": ["en-US", "de-DE"],
+                "versions": None,
+                "is_dubbed": False,
+                "is_subbed": True,
+                "is_clip": False,
+                "is_mature": False,
+                "mature_blocked": False,
+                "is_premium_only": False,
+                "maturity_ratings": ["TV-14"],
+                "extended_maturity_rating": {
+                    "level": "M2",
+                    "rating": "14",
+                    "system": "",
+                },
+                "closed_captions_available": False,
+                "available_offline": False,
+                "hd_flag": True,
+                "duration_ms": 1_440_000,
+                "media_type": "episode",
+                "channel_id": "crunchyroll",
+                "eligible_region": "US",
+                "slug": "",
+                "slug_title": f"episode-{number}",
+                "seo_title": "",
+                "seo_description": "",
+                "description": "",
+                "identifier": "",
+                "listing_id": "",
+                "production_episode_id": "",
+                "recent_variant": "",
+                "roles": [],
+                "images": {"thumbnail": []},
+            }
+            for episode_id, number, air_date in episodes
+        ],
+        "meta": {"versions_considered": False},
+        "rainbow_roll": {
+            "params": {"locale": locale},
+            "headers": {"referer": "https://www.crunchyroll.com/"},
+            "url": f"https://beta-api.crunchyroll.com/content/v2/cms/seasons/{season_id}/episodes",
+        },
+    }
+
+
+def series_data(series_id: str) -> dict[str, Any]:
+    """Returns a minimal Series response for a series."""
+    return {
+        "total": 1,
+        "data": [
+            {
+                "id": series_id,
+                "channel_id": "crunchyroll",
+                "title": f"Series {series_id}",
+                "slug": "",
+                "slug_title": f"series-{series_id}",
+                "description": "",
+                "extended_description": "",
+                "keywords": [],
+                "season_tags": [],
+                "images": {"poster_tall": [], "poster_wide": []},
+                "episode_count": 0,
+                "season_count": 0,
+                "media_count": 0,
+                "content_provider": "",
+                "maturity_ratings": ["TV-14"],
+                "extended_maturity_rating": {"system": "", "rating": "", "level": ""},
+                "is_mature": False,
+                "mature_blocked": False,
+                "is_subbed": True,
+                "is_dubbed": False,
+                "is_simulcast": False,
+                "seo_title": "",
+                "seo_description": "",
+                "subtitle_locales": ["en-US"],
+                "audio_locales": ["ja-JP"],
+                "availability_status": "available",
+                "availability_notes": "",
+                "series_launch_year": 2024,
+            },
+        ],
+        "meta": {},
+        "rainbow_roll": {
+            "params": {"locale": "en-US"},
+            "headers": {"referer": "https://www.crunchyroll.com/"},
+            "url": f"https://beta-api.crunchyroll.com/content/v2/cms/series/{series_id}",
+        },
+    }
+
+
+def seasons_data(series_id: str, *season_ids: str) -> dict[str, Any]:
+    """Returns a minimal Seasons response for the seasons of a series."""
+    return {
+        "total": len(season_ids),
+        "data": [
+            {
+                "id": season_id,
+                "channel_id": "crunchyroll",
+                "title": f"Season {season_id}",
+                "slug_title": f"season-{season_id}",
+                "series_id": series_id,
+                "season_display_number": "",
+                "season_sequence_number": number,
+                "season_number": number,
+                "is_complete": True,
+                "description": "",
+                "keywords": [],
+                "season_tags": [],
+                "images": {},
+                "extended_maturity_rating": {"system": "", "rating": "", "level": ""},
+                "maturity_ratings": ["TV-14"],
+                "is_mature": False,
+                "mature_blocked": False,
+                "is_subbed": True,
+                "is_dubbed": False,
+                "is_simulcast": False,
+                "seo_title": "",
+                "seo_description": "",
+                "availability_notes": "",
+                "audio_locales": ["ja-JP"],
+                "subtitle_locales": ["en-US"],
+                "audio_locale": "ja-JP",
+                "versions": None,
+                "identifier": "",
+                "number_of_episodes": 0,
+            }
+            for number, season_id in enumerate(season_ids, 1)
+        ],
+        "meta": {"versions_considered": False},
+        "rainbow_roll": {
+            "params": {"locale": "en-US", "force_locale": None},
+            "headers": {"referer": "https://www.crunchyroll.com/"},
+            "url": f"https://beta-api.crunchyroll.com/content/v2/cms/series/{series_id}/seasons",
+        },
+    }
+
+
+def browse_data(*entries: tuple[str, str]) -> dict[str, Any]:
+    """Returns a minimal BrowseSeries response for (ID, last public) tuples."""
+    percentage = {"displayed": "0", "percentage": 0, "unit": ""}
+    return {
+        "total": len(entries),
+        "data": [
+            {
+                "id": series_id,
+                "title": f"Series {series_id}",
+                "promo_title": "",
+                "promo_description": "",
+                "description": "",
+                "slug": "",
+                "slug_title": f"series-{series_id}",
+                "type": "series",
+                "channel_id": "crunchyroll",
+                "linked_resource_key": f"cms:/series/{series_id}",
+                "external_id": f"SRZ.{series_id}",
+                "new": False,
+                "last_public": last_public,
+                "images": {"poster_tall": [], "poster_wide": []},
+                "rating": {
+                    "average": "0",
+                    "total": 0,
+                    **{f"{stars}s": percentage for stars in range(1, 6)},
+                },
+                "series_metadata": {
+                    "audio_locales": ["ja-JP"],
+                    "availability_notes": "",
+                    "episode_count": 12,
+                    "extended_description": "",
+                    "extended_maturity_rating": {},
+                    "is_dubbed": False,
+                    "is_mature": False,
+                    "is_simulcast": False,
+                    "is_subbed": True,
+                    "language_presentation": {
+                        "audio_notation": "",
+                        "text_notation": "",
+                    },
+                    "mature_blocked": False,
+                    "maturity_ratings": ["TV-14"],
+                    "season_count": 1,
+                    "series_launch_year": 2024,
+                    "subtitle_locales": ["en-US"],
+                },
+            }
+            for series_id, last_public in entries
+        ],
+        "meta": {},
+    }
+
+
 class TestParsing:
     """Tests for parsing saved JSON files into Pydantic models."""
 
@@ -35,6 +295,731 @@ class TestParsing:
             file_content = json.loads(json_file.read_text())
             client.episodes.parse(file_content)
 
+    def test_parse_objects(self) -> None:
+        """Parse all saved objects JSON files."""
+        for json_file in client.objects.json_files_folder.glob("*.json"):
+            file_content = json.loads(json_file.read_text())
+            client.objects.parse(file_content)
+
+    def test_parse_raw(self) -> None:
+        """Parsing raw bytes builds the same models as parsing a dict."""
+
+        class Entry(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            id: str
+            when: AwareDatetime
+
+        class Response(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            total: int
+            data: list[Entry]
+            rainbow_roll: dict[str, Any] | None = None
+
+        class Extractor(BaseExtractor[Response]):
+            _response_model = Response
+
+        extractor = Extractor()
+        entries = [{"id": "a", "when": "2024-01-01T00:00:00Z"}]
+        metadata = {"url": "https://example.com"}
+
+        for body in ({"total": 1, "data": entries}, {"total": 0, "data": []}):
+            response = RawResponse(json.dumps(body, indent=2).encode(), metadata)
+            parsed = extractor.parse_raw(response)
+            assert parsed == extractor.parse(response.to_dict())
+            assert parsed.rainbow_roll == metadata
+
+    def test_lazy_parse(self) -> None:
+        """Lazily parsed entries are validated when they are first accessed."""
+
+        class Entry(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            id: str
+            when: AwareDatetime
+
+        class Response(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+            total: int
+            data: list[Entry]
+            rainbow_roll: dict[str, Any] | None = None
+
+        class Extractor(BaseExtractor[Response]):
+            _response_model = Response
+
+        extractor = Extractor()
+        entries = [
+            {"id": "a", "when": "2024-01-01T00:00:00Z"},
+            {"id": "b", "when": "not a datetime"},
+        ]
+        response = RawResponse(json.dumps({"total": 2, "data": entries}).encode(), {})
+
+        parsed = extractor.parse_raw(response, lazy=True)
+        assert isinstance(parsed.data, LazyEntries)
+        assert parsed.data[0] == Entry.model_validate(entries[0])
+        with pytest.raises(ValidationError):
+            parsed.data[1]
+
+        entries[1]["when"] = "2024-01-02T00:00:00Z"
+        response = RawResponse(json.dumps({"total": 2, "data": entries}).encode(), {})
+        extractor.lazy_parse = True
+        parsed = extractor.parse_raw(response)
+        assert [entry.id for entry in parsed.data] == ["a", "b"]
+        assert parsed == extractor.parse_raw(response, lazy=False)
+        assert type(extractor.parse_raw(response, lazy=False).data) is list
+
+
+class TestParseProfiler:
+    """Tests for profiling parse costs."""
+
+    def test_profile(self) -> None:
+        """The cost of each nested model and field type is recorded."""
+
+        class Inner(BaseModel):
+            when: AwareDatetime
+
+        class Outer(BaseModel):
+            name: str
+            items: list[Inner]
+
+        profiler = ParseProfiler()
+        data = {"name": "a", "items": [{"when": "2024-01-01T00:00:00Z"}] * 3}
+
+        assert profiler.profile(Outer, data) == Outer.model_validate(data)
+        assert profiler.models[f"{__name__}.Outer"].calls == 1
+        assert profiler.models[f"{__name__}.Inner"].calls == len(data["items"])
+        assert profiler.fields["AwareDatetime"].calls == len(data["items"])
+        assert "AwareDatetime" in profiler.report()
+
+    def test_profiled_parse(self) -> None:
+        """Profiled responses are still parsed by GAPIClient.parse."""
+
+        class Entry(BaseModel):
+            id: str
+
+        class Recorder(GAPIClient[Entry]):
+            parsed: list[dict[str, Any]]
+
+            def parse(self, data: dict[str, Any]) -> Entry:
+                self.parsed.append(data)
+                return super().parse(data)
+
+        class Extractor(BaseExtractor[Entry], Recorder):
+            _response_model = Entry
+
+        extractor = Extractor()
+        extractor.parsed = []
+        extractor.parse_profiler = ParseProfiler()
+
+        assert extractor.parse({"id": "a"}) == Entry(id="a")
+        assert extractor.parsed == [{"id": "a"}]
+        assert extractor.parse_profiler.models[f"{__name__}.Entry"].calls == 1
+
+
+class TestProjection:
+    """Tests for parsing selected fields into records."""
+
+    def test_projection(self) -> None:
+        """Only the selected fields are parsed, using the model's types and aliases."""
+
+        class Entry(BaseModel):
+            id: str
+            when: AwareDatetime
+            score: int = Field(alias="5s")
+            note: str | None = None
+
+        projection = Projection.of(Entry, "id", "when", "score", "note")
+        data = {
+            "total": 1,
+            "data": [{"id": "a", "when": "2024-01-01T00:00:00Z", "5s": 5, "x": {}}],
+        }
+
+        records = projection.parse_raw(json.dumps(data).encode())
+
+        assert records == projection.parse(data)
+        assert records[0].when == datetime.fromisoformat("2024-01-01T00:00:00Z")
+        assert records[0].score == data["data"][0]["5s"]
+        assert records[0].note is None
+        with pytest.raises(ValueError, match="missing"):
+            Projection.of(Entry, "missing")
+
+
+class TestInterner:
+    """Tests for sharing repeated values between models."""
+
+    def test_intern(self) -> None:
+        """Equal strings and lists in interned fields become the same objects."""
+
+        class Version(BaseModel):
+            audio_locale: str
+
+        class Entry(BaseModel):
+            subtitle_locales: list[str]
+            versions: list[Version]
+
+        interner = Interner()
+        first, second = (
+            interner.intern(
+                Entry.model_validate(
+                    json.loads(
+                        '{"subtitle_locales": ["en-US", "de-DE"], '
+                        '"versions": [{"audio_locale": "ja-JP"}]}',
+                    ),
+                ),
+            )
+            for _ in range(2)
+        )
+
+        assert first.subtitle_locales is second.subtitle_locales
+        assert first.versions[0].audio_locale is second.versions[0].audio_locale
+
+    def test_intern_max_lists(self) -> None:
+        """Lists stop being pooled once the pool is full."""
+
+        class Entry(BaseModel):
+            subtitle_locales: list[str]
+
+        interner = Interner(max_lists=1)
+        first, second, third = (
+            interner.intern(Entry(subtitle_locales=locales))
+            for locales in (["en-US"], ["de-DE"], ["en-US"])
+        )
+
+        assert first.subtitle_locales is third.subtitle_locales
+        fourth = interner.intern(Entry(subtitle_locales=["de-DE"]))
+        assert fourth.subtitle_locales is not second.subtitle_locales
+
+
+class TestIndexedEntries:
+    """Tests for collections of entries indexed by ID."""
+
+    def test_dedupe_and_indexes(self) -> None:
+        """Duplicate IDs keep the freshest entry and indexes follow replacements."""
+
+        class Entry(BaseModel):
+            id: str
+            last_public: AwareDatetime
+            channel_id: str
+            tags: list[str]
+
+        now = datetime.now().astimezone()
+        old = Entry(id="a", last_public=now, channel_id="x", tags=["t"])
+        new = Entry(id="a", last_public=now + timedelta(1), channel_id="y", tags=[])
+        other = Entry(id="b", last_public=now, channel_id="y", tags=["t"])
+
+        entries = IndexedEntries([old, new, other, old], indexes=["channel_id", "tags"])
+
+        assert list(entries) == [new, other]
+        assert entries["a"] is new
+        assert entries.by("channel_id", "x") == []
+        assert entries.by("channel_id", "y") == [new, other]
+        assert entries.by("tags", "t") == [other]
+
+
+class TestEpisodeGraph:
+    """Tests for navigating between episodes."""
+
+    def test_navigation(self) -> None:
+        """Episodes are ordered within seasons and seasons within the series."""
+
+        def episode(episode_id: str, season_id: str, number: int) -> Datum:
+            return Datum.model_construct(
+                id=episode_id,
+                series_id="series",
+                season_id=season_id,
+                season_sequence_number=int(season_id[-1]),
+                sequence_number=float(number),
+                episode_number=number,
+            )
+
+        graph = EpisodeGraph()
+        graph.add_episodes([episode("s2e1", "s2", 1), episode("s1e2", "s1", 2)])
+        graph.add_episodes([episode("s1e1", "s1", 1)])
+
+        order = [entry.id for entry in graph.watch_order("series")]
+        assert order == ["s1e1", "s1e2", "s2e1"]
+        assert graph.next("s1e2").id == "s2e1"  # type: ignore[union-attr]
+        assert graph.previous("s2e1").id == "s1e2"  # type: ignore[union-attr]
+        assert graph.previous("s1e1") is None
+        assert graph.find_episode("s1", 2).id == "s1e2"  # type: ignore[union-attr]
+
+
+class TestSession:
+    """Tests for the shared HTTP session."""
+
+    def test_custom_session(self) -> None:
+        """A custom session is used by the client and left open when it closes."""
+        closed: list[bool] = []
+        session = requests.Session()
+        session.close = lambda: closed.append(True)  # type: ignore[method-assign]
+
+        with RainbowRoll(session=session) as custom_client:
+            assert custom_client.session is session
+
+        assert not closed
+
+
+class TestResponseCache:
+    """Tests for the on-disk response cache."""
+
+    def test_ttl(self, tmp_path: Path) -> None:
+        """Responses expire based on the time to live of their endpoint."""
+        cache = ResponseCache(
+            tmp_path / "cache.db",
+            ttls={r"content/v2/discover/browse": timedelta(0)},
+        )
+        params = {"locale": "en-US"}
+        cache.set("content/v2/discover/browse", params, b"{}", etag="abc")
+        cache.set("content/v2/cms/series/GG5H5XQ0D", params, b"{}")
+
+        browse = cache.get("content/v2/discover/browse", params)
+        series = cache.get("content/v2/cms/series/GG5H5XQ0D", params)
+
+        assert browse is not None
+        assert not browse.fresh
+        assert browse.conditional_headers() == {"If-None-Match": "abc"}
+        assert series is not None
+        assert series.fresh
+        assert cache.get("content/v2/cms/series/GG5H5XQ0D", {"locale": "de-DE"}) is None
+
+
+class TestModelCache:
+    """Tests for the in-memory model cache."""
+
+    def test_lru(self) -> None:
+        """The least recently used model is evicted when the cache is full."""
+        cache: ModelCache[str] = ModelCache(max_entries=2)
+        cache.set("a", "a")
+        cache.set("b", "b")
+        cache.get("a")
+        cache.set("c", "c")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+        assert cache.stats.evictions == 1
+
+    def test_ttl(self) -> None:
+        """Expired models are treated as missing."""
+        cache: ModelCache[str] = ModelCache(ttl=timedelta(0))
+        cache.set("a", "a")
+
+        assert cache.get("a") is None
+        assert cache.stats.misses == 1
+
+
+class TestCassette:
+    """Tests for recording and replaying responses."""
+
+    def test_record_and_replay(self, tmp_path: Path) -> None:
+        """Recorded responses are replayed without a network."""
+        path = tmp_path / "cassette.jsonl.gz"
+        endpoint = "content/v2/discover/browse"
+
+        with (
+            MockServer(MockAPI({})) as server,
+            RainbowRoll(cassette=Cassette(path, record=True)) as recording,
+        ):
+            server.configure(recording)
+            recorded = recording.download_raw(endpoint, {"n": 1})
+
+        replaying = RainbowRoll(cassette=Cassette(path))
+        replayed = replaying.download_raw(endpoint, {"n": 1})
+
+        assert replayed.body == recorded.body
+        with pytest.raises(CassetteMissError):
+            replaying.download_raw(endpoint, {"n": 2})
+
+
+class TestTokenStore:
+    """Tests for persisting tokens."""
+
+    def test_file_token_store(self, tmp_path: Path) -> None:
+        """Tokens saved to a file can be loaded again."""
+        store = FileTokenStore(tmp_path / "tokens.json")
+        tokens = Tokens("public", "access", "refresh", token_expiry(300))
+
+        with store.lock():
+            store.save("anonymous", tokens)
+
+        assert store.load("anonymous") == tokens
+        assert store.load("username") is None
+
+    def test_async_clients_share_tokens(self, tmp_path: Path) -> None:
+        """Async clients sharing a store download a single access token."""
+        pytest.importorskip("httpx")
+        from rainbow_roll.async_client import AsyncRainbowRoll  # noqa: PLC0415
+
+        events: list[Event] = []
+        store = FileTokenStore(tmp_path / "tokens.json")
+
+        async def download(server: MockServer) -> None:
+            clients = [
+                AsyncRainbowRoll(
+                    token_store=store,
+                    instrumentation=Instrumentation(events.append),
+                )
+                for _ in range(3)
+            ]
+            for async_client in clients:
+                server.configure(async_client)
+            await asyncio.gather(*(c.access_token() for c in clients))
+            await asyncio.gather(*(c.aclose() for c in clients))
+
+        with MockServer(MockAPI({})) as server:
+            asyncio.run(download(server))
+
+        access = [
+            e for e in events if isinstance(e, TokenRefreshed) and e.kind == "access"
+        ]
+        assert len(access) == 1
+
+
+class TestSyncStore:
+    """Tests for persisting sync watermarks."""
+
+    def test_file_sync_store(self, tmp_path: Path) -> None:
+        """Sync state saved to a file can be loaded again."""
+        store = FileSyncStore(tmp_path / "sync.json")
+        watermark = Watermark(datetime.now().astimezone(), {"GG5H5XQ0D"})
+        state = SyncState(watermark, pending=watermark, next_start=36)
+
+        store.save("browse_series", state)
+
+        assert store.load("browse_series") == state
+        assert store.load("other") is None
+
+    def test_browse_sync_resume(self, tmp_path: Path) -> None:
+        """An interrupted sync resumes from its checkpoint and commits its watermark."""
+        browse = browse_data(
+            ("A", "2024-01-05T00:00:00Z"),
+            ("B", "2024-01-04T00:00:00Z"),
+            ("C", "2024-01-03T00:00:00Z"),
+            ("D", "2024-01-02T00:00:00Z"),
+            ("E", "2024-01-02T00:00:00Z"),
+            ("F", "2024-01-01T00:00:00Z"),
+        )
+        synced = Watermark(datetime.fromisoformat("2024-01-02T00:00:00Z"), {"D"})
+        newest = Watermark(datetime.fromisoformat("2024-01-05T00:00:00Z"), {"A"})
+        store = FileSyncStore(tmp_path / "sync.json")
+        store.save("browse_series", SyncState(synced))
+
+        api = MockAPI({"browse_series": [browse]})
+        with RainbowRoll(adapter=MockAdapter(api)) as mock_client:
+            sync = BrowseSync(mock_client, store, n=2)
+
+            # Stop partway through the second page, after the first was checkpointed.
+            run = sync.run()
+            assert [next(run).id for _ in range(3)] == ["A", "B", "C"]
+            run.close()
+            assert store.load("browse_series") == SyncState(synced, newest, 2)
+
+            # The second page is downloaded again, D was already synced at the same
+            # last_public, and F is older than the watermark.
+            assert [entry.id for entry in sync.run()] == ["C", "E"]
+            assert store.load("browse_series") == SyncState(newest)
+
+            assert list(sync.run()) == []
+            assert sync.watermark == newest
+
+
+class TestCatalog:
+    """Tests for storing models in the local catalog."""
+
+    def test_add_episodes(self, tmp_path: Path) -> None:
+        """Episodes are upserted per locale and queried by season and air date."""
+        catalog = Catalog(tmp_path / "catalog.db")
+        first = ("e1", 1, "2024-01-01T00:00:00Z")
+        second = ("e2", 2, "2024-01-08T00:00:00Z")
+        episodes = client.episodes.parse(
+            episodes_data("s1", second, first, locale="de-DE"),
+        )
+
+        assert catalog.add(episodes) == len(episodes.data)
+        assert catalog.episodes_of("s1", locale="de-DE") == episodes.data[::-1]
+        assert catalog.episodes_of("s1") == []
+
+        renamed = episodes.data[1].model_copy(update={"title": "Renamed"})
+        catalog.upsert_episodes([renamed], locale="de-DE")
+        stored = catalog.episodes_of("s1", locale="de-DE")
+        assert [episode.title for episode in stored] == ["Renamed", "Episode 2"]
+
+        aired = catalog.episodes_aired_since(
+            datetime.fromisoformat(second[2]),
+            locale="de-DE",
+        )
+        assert [episode.id for episode in aired] == ["e2"]
+
+        catalog.close()
+
+
+class TestExport:
+    """Tests for exporting models to Arrow and Parquet.
+
+    pyarrow comes with the arrow extra, so these are skipped without it.
+    """
+
+    def test_episodes_schema(self) -> None:
+        """Timestamps are int64 based and locales are dictionary encoded."""
+        pa = pytest.importorskip("pyarrow")
+
+        from rainbow_roll.episodes import models  # noqa: PLC0415
+        from rainbow_roll.export import ColumnarExporter  # noqa: PLC0415
+
+        schema = ColumnarExporter(models.Datum).schema
+
+        assert schema.field("episode_air_date").type == pa.timestamp("us", tz="UTC")
+        assert pa.types.is_dictionary(schema.field("audio_locale").type)
+        assert schema.field("extended_maturity_rating.rating").type == pa.string()
+
+    def test_write_parquet(self, tmp_path: Path) -> None:
+        """Episodes are written to Parquet with one row each."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        from rainbow_roll.episodes import models  # noqa: PLC0415
+        from rainbow_roll.export import ColumnarExporter  # noqa: PLC0415
+
+        entries = client.episodes.parse(
+            episodes_data(
+                "s1",
+                ("e1", 1, "2024-01-01T00:00:00Z"),
+                ("e2", 2, "2024-01-08T00:00:00Z"),
+            ),
+        ).data
+        path = tmp_path / "episodes.parquet"
+
+        rows = ColumnarExporter(models.Datum).write_parquet(entries, path)
+
+        assert rows == len(entries)
+        assert pq.read_metadata(path).num_rows == len(entries)
+        table = pq.read_table(path)
+        assert table.column("id").to_pylist() == ["e1", "e2"]
+        assert table.column("episode_air_date").to_pylist() == [
+            entry.episode_air_date for entry in entries
+        ]
+
+
+class TestMockServer:
+    """Tests for the local mock API."""
+
+    def test_browse_paging(self) -> None:
+        """Browse pages are served newest first and respect start and n."""
+        entries = [
+            {"id": str(i), "last_public": f"2024-01-0{i}T00:00:00Z"} for i in (1, 2, 3)
+        ]
+        api = MockAPI({"browse_series": [{"total": 3, "data": entries, "meta": {}}]})
+
+        status, _, body = api.handle("GET", "/content/v2/discover/browse?start=1&n=1")
+        page = json.loads(body)
+
+        assert status == HTTPStatus.OK
+        assert page["total"] == len(entries)
+        assert [entry["id"] for entry in page["data"]] == ["2"]
+
+    def test_faults(self) -> None:
+        """Throttled responses include a Retry-After header."""
+        api = MockAPI({}, FaultConfig(throttle_rate=1, retry_after=5))
+
+        status, headers, _ = api.handle("GET", "/content/v2/cms/series/GG5H5XQ0D")
+
+        assert status == HTTPStatus.TOO_MANY_REQUESTS
+        assert headers["Retry-After"] == "5"
+
+    def test_token_faults(self) -> None:
+        """Token requests that keep failing are retried and then raise HTTPError."""
+        api = MockAPI({}, FaultConfig(throttle_rate=1, retry_after=0))
+        policy = RetryPolicy(max_attempts=2)
+
+        with (
+            MockServer(api) as server,
+            RainbowRoll(retry_policy=policy) as faulty_client,
+        ):
+            server.configure(faulty_client)
+            with pytest.raises(HTTPError, match="429"):
+                faulty_client.download_raw("content/v2/cms/series/GG5H5XQ0D", {})
+
+    def test_configure(self) -> None:
+        """A configured client authenticates against the mock server."""
+        with MockServer(MockAPI({})) as server:
+            mock_client = RainbowRoll()
+            server.configure(mock_client)
+
+            response = mock_client.session.get(
+                f"http://{server.address}/content/v2/cms/series/GG5H5XQ0D",
+                timeout=5,
+            )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert mock_client.bundle_js_url.startswith("http://127.0.0.1:")
+
+    def test_async_crawl_empty_browse(self) -> None:
+        """An async crawl of an empty browse page finds no series."""
+        pytest.importorskip("httpx")
+        from rainbow_roll.async_client import AsyncRainbowRoll  # noqa: PLC0415
+        from rainbow_roll.crawler import AsyncCrawler  # noqa: PLC0415
+
+        async def crawl(server: MockServer) -> list[SeriesNode]:
+            async with AsyncRainbowRoll() as async_client:
+                server.configure(async_client)
+                crawler = AsyncCrawler(async_client)
+                return [node async for node in crawler.crawl_since()]
+
+        with MockServer(MockAPI({})) as server:
+            assert asyncio.run(crawl(server)) == []
+
+
+class TestInstrumentation:
+    """Tests for request events and metrics."""
+
+    def test_events(self) -> None:
+        """Requests and token downloads are reported and aggregated."""
+        events: list[Event] = []
+        instrumentation = Instrumentation(events.append)
+
+        with (
+            MockServer(MockAPI({})) as server,
+            RainbowRoll(instrumentation=instrumentation) as instrumented,
+        ):
+            server.configure(instrumented)
+            instrumented.download_raw("content/v2/discover/browse", {"n": 1})
+
+        assert [type(event) for event in events] == [
+            RequestStarted,
+            TokenRefreshed,
+            TokenRefreshed,
+            RequestFinished,
+        ]
+        finished = events[-1]
+        assert isinstance(finished, RequestFinished)
+        assert finished.status == HTTPStatus.OK
+        assert finished.retries == 0
+        assert finished.time_to_first_byte is not None
+
+        metrics = instrumentation.metrics.to_dict()
+        assert metrics["counters"]["rainbow_roll_requests_total"] == [
+            {
+                "labels": {
+                    "route": "browse_series",
+                    "source": "network",
+                    "status": "200",
+                },
+                "value": 1,
+            },
+        ]
+        prometheus = instrumentation.metrics.to_prometheus()
+        assert "rainbow_roll_request_seconds_bucket" in prometheus
+        assert "rainbow_roll_connect_seconds_bucket" in prometheus
+
+    def test_request_phases(self) -> None:
+        """Requests are split into connecting, the first byte, and the download."""
+
+        # ANN401 - The options are passed through to the client.
+        def phases(**kwargs: Any) -> list[RequestFinished]:  # noqa: ANN401
+            events: list[Event] = []
+            with (
+                MockServer(MockAPI({})) as server,
+                RainbowRoll(
+                    instrumentation=Instrumentation(events.append),
+                    **kwargs,
+                ) as instrumented,
+            ):
+                server.configure(instrumented)
+                for _ in range(2):
+                    instrumented.download_raw("content/v2/discover/browse", {})
+            return [event for event in events if isinstance(event, RequestFinished)]
+
+        # The connection opened for the tokens is reused by both requests.
+        assert [event.connect_time for event in phases()] == [0, 0]
+        for event in phases(keep_alive=False):
+            assert event.connect_time
+            assert event.time_to_first_byte is not None
+            assert event.download_time is not None
+            assert event.connect_time + event.time_to_first_byte <= event.elapsed
+
+        # A custom adapter is not timed.
+        assert {
+            event.connect_time for event in phases(adapter=MockAdapter(MockAPI({})))
+        } == {None}
+
+    def test_async_request_phases(self) -> None:
+        """The async client times each phase from httpx's trace extension."""
+        pytest.importorskip("httpx")
+        from rainbow_roll.async_client import AsyncRainbowRoll  # noqa: PLC0415
+
+        events: list[Event] = []
+
+        async def download(server: MockServer) -> None:
+            async with AsyncRainbowRoll(
+                instrumentation=Instrumentation(events.append),
+            ) as instrumented:
+                server.configure(instrumented)
+                await instrumented.download_raw("content/v2/discover/browse", {})
+
+        with MockServer(MockAPI({})) as server:
+            asyncio.run(download(server))
+
+        finished = events[-1]
+        assert isinstance(finished, RequestFinished)
+        assert finished.connect_time is not None
+        assert finished.time_to_first_byte is not None
+        assert finished.download_time is not None
+
+    def test_failed_request(self) -> None:
+        """Requests that fail are reported with their status and error."""
+        events: list[Event] = []
+        instrumentation = Instrumentation(events.append)
+
+        with (
+            MockServer(MockAPI({})) as server,
+            RainbowRoll(instrumentation=instrumentation) as instrumented,
+        ):
+            server.configure(instrumented)
+            with pytest.raises(HTTPError):
+                instrumented.download_raw("content/v2/cms/series/missing", {})
+
+        finished = events[-1]
+        assert isinstance(finished, RequestFinished)
+        assert finished.status == HTTPStatus.NOT_FOUND
+        assert finished.error == "HTTPError"
+
+        counters = instrumentation.metrics.to_dict()["counters"]
+        assert counters["rainbow_roll_request_errors_total"] == [
+            {"labels": {"error": "HTTPError", "route": "series"}, "value": 1},
+        ]
+
+
+class TestRateLimit:
+    """Tests for rate limiting and retries."""
+
+    def test_rate_limiter_adapts(self) -> None:
+        """The rate drops when throttled and recovers up to the maximum rate."""
+        limiter = RateLimiter(rate=10, max_rate=10, increase=2)
+        limiter.throttled()
+        assert limiter.rate == 5  # noqa: PLR2004
+
+        for _ in range(5):
+            limiter.succeeded()
+        assert limiter.rate == 10  # noqa: PLR2004
+
+    def test_rate_limiter_observe(self) -> None:
+        """Only successful responses raise the rate."""
+        limiter = RateLimiter(rate=10, max_rate=20, increase=1)
+        limiter.observe(429)
+        assert limiter.rate == 5  # noqa: PLR2004
+
+        for status_code in (404, 500, 503):
+            limiter.observe(status_code)
+        assert limiter.rate == 5  # noqa: PLR2004
+
+        limiter.observe(200)
+        limiter.observe(304)
+        assert limiter.rate == 7  # noqa: PLR2004
+
+    def test_retry_delay(self) -> None:
+        """Retry-After is respected and backoff is capped."""
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+        assert policy.delay(0, "2") == 2  # noqa: PLR2004
+        assert policy.delay(0, "60") == 4  # noqa: PLR2004
+        assert 0 <= policy.delay(10) <= 4  # noqa: PLR2004
+
 
 class TestGet:
     """Tests for downloading and parsing live data from Crunchyroll."""
@@ -55,6 +1040,89 @@ class TestGet:
         """Download and parse episodes."""
         client.episodes.get("G619CPMQ1")
 
+    def test_get_objects(self) -> None:
+        """Download and parse a batch of objects."""
+        client.objects.get(["GG5H5XQ0D", "GRDQPM1ZY"])
+
+
+class TestObjects:
+    """Tests for batched object lookups."""
+
+    def test_batches(self) -> None:
+        """IDs are deduplicated and split in order into capped batches."""
+        object_ids = [str(i) for i in range(MAX_BATCH_SIZE + 10)]
+
+        batches = _batches([*object_ids, "0", "5"], MAX_BATCH_SIZE * 2)
+
+        assert [len(batch) for batch in batches] == [MAX_BATCH_SIZE, 10]
+        assert [object_id for batch in batches for object_id in batch] == object_ids
+        assert _batches(["b", "a", "b", "c"], 2) == [["b", "a"], ["c"]]
+
+    def test_parse_object_types(self) -> None:
+        """Objects of every type are parsed, keeping their type-specific fields."""
+        data = {
+            "total": 2,
+            "data": [
+                {"id": "a", "type": "season", "season_metadata": {}, "new": 1},
+                {"id": "b", "type": "movie_listing", "movie_listing_metadata": {}},
+            ],
+            "meta": {},
+        }
+
+        parsed = client.objects.parse(data)
+
+        assert [entry.type for entry in parsed.data] == ["season", "movie_listing"]
+        assert parsed.data[0].model_extra == {"new": 1}
+
+    def test_get_many(self) -> None:
+        """Batches are downloaded concurrently and returned in batch order."""
+        object_ids = [f"G{i}" for i in range(7)]
+        batches = _batches(object_ids, 2)
+        url = "https://beta-api.crunchyroll.com/content/v2/cms/objects/"
+        api = MockAPI(
+            {
+                "objects": [
+                    {
+                        "total": len(batch),
+                        "data": [
+                            {"id": object_id, "type": "episode"} for object_id in batch
+                        ],
+                        "rainbow_roll": {"url": url + ",".join(batch)},
+                    }
+                    for batch in batches
+                ],
+            },
+            FaultConfig(latency=0.01),
+        )
+
+        with MockServer(api) as server, RainbowRoll() as mock_client:
+            server.configure(mock_client)
+            results = mock_client.objects.get_many(
+                [*object_ids, "G0"],
+                batch_size=2,
+                max_workers=4,
+            )
+
+        assert [[entry.id for entry in result.data] for result in results] == batches
+
+
+class TestAsyncGet:
+    """Tests for downloading and parsing live data with the asyncio client."""
+
+    def test_get_series_and_seasons(self) -> None:
+        """Download and parse a series and its seasons concurrently."""
+        pytest.importorskip("httpx")
+        from rainbow_roll.async_client import AsyncRainbowRoll  # noqa: PLC0415
+
+        async def get() -> None:
+            async with AsyncRainbowRoll() as async_client:
+                await asyncio.gather(
+                    async_client.series.get("GG5H5XQ0D"),
+                    async_client.seasons.get("GG5H5XQ0D"),
+                )
+
+        asyncio.run(get())
+
 
 class TestCustomGet:
     """Tests for custom endpoint methods."""
@@ -72,3 +1140,92 @@ class TestCustomGet:
 
         # Each page of results has 36 entries so there should be at least 36 entries.
         assert len(client.browse_series.entries(response)) >= 36  # noqa: PLR2004
+
+    def test_get_browse_series_since_datetime_parallel(self) -> None:
+        """Download browse series pages in parallel."""
+        first_page = client.browse_series.get(n=10)
+        end_datetime = first_page.data[-1].last_public - timedelta(days=7)
+
+        serial = client.browse_series.get_since_datetime(end_datetime=end_datetime)
+        parallel = client.browse_series.get_since_datetime(
+            end_datetime=end_datetime,
+            max_workers=4,
+        )
+
+        assert len(parallel) == len(serial)
+
+    def test_iter_entries(self) -> None:
+        """Stop iterating browse series entries partway through the first page."""
+        entries = client.browse_series.iter_entries(n=10, prefetch=2)
+        first_entries = [entry for _, entry in zip(range(5), entries, strict=False)]
+
+        assert len(first_entries) == 5  # noqa: PLR2004
+
+
+class TestSync:
+    """Tests for syncing live data from Crunchyroll."""
+
+    def test_sync(self, tmp_path: Path) -> None:
+        """Sync the last week of content, then sync again from the watermark."""
+        sync = BrowseSync(client, FileSyncStore(tmp_path / "sync.json"))
+        entries = list(sync.run(since=datetime.now().astimezone() - timedelta(days=7)))
+
+        assert entries
+        assert sync.watermark is not None
+        assert sync.watermark.last_public == entries[0].last_public
+
+
+class TestCrawler:
+    """Tests for crawling series, seasons, and episodes."""
+
+    def test_crawl(self) -> None:
+        """Crawl a series, its seasons, and their episodes."""
+        nodes = list(Crawler(client).crawl(["GG5H5XQ0D", "GG5H5XQ0D"]))
+
+        assert len(nodes) == 1
+        assert nodes[0].seasons
+        assert all(season_node.episodes for season_node in nodes[0].seasons)
+
+    def test_mock_crawl(self) -> None:
+        """Duplicate series and shared seasons are only fetched once."""
+        air_date = "2024-01-01T00:00:00Z"
+        api = MockAPI(
+            {
+                "series": [series_data("S1"), series_data("S2")],
+                "seasons": [
+                    seasons_data("S1", "X", "Y"),
+                    seasons_data("S2", "Y", "Z"),
+                ],
+                "episodes": [
+                    episodes_data("X", ("x1", 1, air_date), ("x2", 2, air_date)),
+                    episodes_data("Y", ("y1", 1, air_date)),
+                    episodes_data("Z", *((f"z{i}", i, air_date) for i in (1, 2, 3))),
+                ],
+            },
+        )
+        updates: list[CrawlProgress] = []
+
+        with RainbowRoll(adapter=MockAdapter(api)) as mock_client:
+            crawler = Crawler(mock_client, max_workers=4, progress=updates.append)
+            nodes = list(crawler.crawl(["S1", "S2", "S1"]))
+
+            # A paused crawl is not affected by another crawl started meanwhile.
+            paused = crawler.crawl(["S1", "S2"])
+            first = next(paused)
+            assert len(list(crawler.crawl(["S2"]))) == 1
+            assert len([first, *paused]) == len(nodes)
+
+        assert sorted(node.id for node in nodes) == ["S1", "S2"]
+        assert all(node.series and node.series.id == node.id for node in nodes)
+        episodes = {
+            season_node.season.id: [episode.id for episode in season_node.episodes]
+            for node in nodes
+            for season_node in node.seasons
+        }
+        assert episodes == {"X": ["x1", "x2"], "Y": ["y1"], "Z": ["z1", "z2", "z3"]}
+
+        progress = updates[-1]
+        assert progress.requests == 7  # noqa: PLR2004
+        assert progress.series_done == progress.series_total == len(nodes)
+        assert progress.seasons_done == len(episodes)
+        assert progress.episodes_done == 6  # noqa: PLR2004